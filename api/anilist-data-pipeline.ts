@@ -184,7 +184,7 @@ async function convertAnimeToSystemFormat(animeList: AnimeDetails[]): Promise<An
           poster: anime.coverImage?.extraLarge || anime.coverImage?.large || anime.coverImage?.medium,
           thumbnail: anime.coverImage?.medium,
         },
-        synopsis: anime.description || '',
+        synopsis: (anime.description || '').replace(/<[^>]*>/g, ''), // Strip HTML once at ingest
         alternativeTitles: [
           anime.title.english,
           anime.title.native
@@ -194,11 +194,6 @@ async function convertAnimeToSystemFormat(animeList: AnimeDetails[]): Promise<An
     
     const batchResults = await Promise.all(batchPromises);
     results.push(...batchResults);
-    
-    // Add a delay between batches to avoid overwhelming any systems
-    if (i + batchSize < animeList.length) {
-      await new Promise(resolve => setTimeout(resolve, 500)); // Shorter delay since we're not calling external APIs
-    }
   }
   
   return results;
@@ -292,15 +287,15 @@ function inferAnimeAttributes(anime: AnimeTitle): EnrichedAnimeTitle {
 }
 
 /**
- * Remove duplicate anime based on ID
+ * Remove duplicate anime based on ID, keeping the first occurrence
  */
-function removeDuplicates(animeList: AnimeTitle[]): AnimeTitle[] {
-  const seen = new Map<string, boolean>();
+function removeDuplicates<T extends { id: string | number }>(animeList: T[]): T[] {
+  const seen = new Set<string | number>();
   return animeList.filter(anime => {
     if (seen.has(anime.id)) {
       return false;
     }
-    seen.set(anime.id, true);
+    seen.add(anime.id);
     return true;
   });
 }
@@ -347,14 +342,13 @@ async function main() {
     const combinedAnime = [...popularAnime, ...topRatedAnime];
     console.log(`Combined anime list has ${combinedAnime.length} titles (with duplicates)`);
     
+    // Remove duplicates before conversion so titles in both lists are only converted once
+    const uniqueAnime = removeDuplicates(combinedAnime);
+    console.log(`Removed ${combinedAnime.length - uniqueAnime.length} duplicate anime, ${uniqueAnime.length} remain`);
+    
     // Convert to our system format and enrich with cross-platform IDs
     console.log("Converting to system format and enriching with cross-platform IDs...");
-    let convertedAnime = await convertAnimeToSystemFormat(combinedAnime);
-    
-    // Remove duplicates
-    const originalCount = convertedAnime.length;
-    convertedAnime = removeDuplicates(convertedAnime);
-    console.log(`Removed ${originalCount - convertedAnime.length} duplicate anime, ${convertedAnime.length} remain`);
+    const convertedAnime = await convertAnimeToSystemFormat(uniqueAnime);
     
     // Save ID mappings for future use
     saveIdMappings(convertedAnime);
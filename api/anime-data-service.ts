@@ -9,7 +9,6 @@ import fs from 'fs';
 import path from 'path';
 import { AnimeApiAdapter, createApiAdapter } from '../app/lib/anime-api-adapter';
 import { AnimeTitle } from '../data-models';
-import { runAniListPipeline } from './anilist-data-pipeline';
 
 // Configuration
 const DATA_DIR = path.join(process.cwd(), 'data');
@@ -111,6 +110,9 @@ export class AnimeDataService {
   public async refreshAnimeData(): Promise<void> {
     try {
       console.log('Running AniList data pipeline...');
+      // Load the pipeline (and the provider clients it pulls in) only when a
+      // refresh is actually needed; a warm cache never touches it
+      const { runAniListPipeline } = await import('./anilist-data-pipeline');
       await runAniListPipeline();
       
       // After pipeline completes, load the updated data
@@ -94,7 +94,7 @@ export class MCPAnimeIntegration {
     // 3. Calculate match scores
     const animeWithScores = animeWithDimensions.map(({ anime, dimensions }) => {
       const score = calculateMatchScore(dimensions, userProfile.dimensions);
-      const matchReasons = getMatchExplanations(anime, userProfile.dimensions);
+      const matchReasons = getMatchExplanations(dimensions, userProfile.dimensions);
 
       return {
         anime,
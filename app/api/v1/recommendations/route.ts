@@ -1,17 +1,104 @@
 import { NextRequest, NextResponse } from 'next/server';
-import { db, Profile } from '@/app/lib/db';
+import { db, dumpStorage, Profile } from '@/app/lib/db';
 import { createApiAdapter } from '@/app/lib/anime-api-adapter';
 import { corsHeaders, ensureSessionProfile } from '@/app/lib/utils';
-import { calculateMatchScore, getMatchExplanations } from '@/app/lib/anime-attribute-mapper';
+import { calculateMatchScore, getMatchExplanations, mapAnimeToDimensions } from '@/app/lib/anime-attribute-mapper';
 import malSyncClient from '@/app/lib/utils/malsync/client';
 import { getImageUrlFromManualMapping, manualMappings } from '@/app/lib/utils/malsync/manual-mappings';
-import { VideoId } from '@/app/lib/providers/youtube/client';
+import type { VideoId, YouTubeClient } from '@/app/lib/providers/youtube/client';
+import type { TMDbClient } from '@/app/lib/providers/tmdb/client';
 import { getAnimeDataService } from '../../../../api/anime-data-service';
-import { recommendAnime } from '../../../../recommendation-engine';
+import { recommendAnime, selectTopK } from '../../../../recommendation-engine';
 
 // Set dynamic runtime to handle URL search parameters
 export const dynamic = 'force-dynamic';
 
+// Manual trailer mapping for popular anime, built once at module load.
+// The recommendation loop only uses these; anything else goes to the YouTube
+// search first
+const POPULAR_TRAILER_MAP: Record<string, string> = {
+  '5114': 'https://www.youtube.com/watch?v=--IcmZkvL0Q', // FMA:B
+  '1535': 'https://www.youtube.com/watch?v=NlJZ-YgAt-c', // Death Note
+  '16498': 'https://www.youtube.com/watch?v=MGRm4IzK1SQ', // Attack on Titan
+  '20583': 'https://www.youtube.com/watch?v=vGuQeQsoRgU', // Tokyo Ghoul
+  '11757': 'https://www.youtube.com/watch?v=6ohYYtxfDCg', // Sword Art Online
+  '21856': 'https://www.youtube.com/watch?v=EPVkcwyLQQ8', // My Hero Academia
+  '101922': 'https://www.youtube.com/watch?v=VQGCKyvzIM4', // Demon Slayer
+  '20': 'https://www.youtube.com/watch?v=QczGoCmX-pI', // Naruto
+  '21': 'https://www.youtube.com/watch?v=S8_YwFLCh4U', // One Piece
+  '269': 'https://www.youtube.com/watch?v=0yk5H6vvMEk', // Bleach
+};
+
+// Fuller mapping used by getTrailerForAnime
+const MANUAL_TRAILER_MAP: Record<string, string> = {
+  ...POPULAR_TRAILER_MAP,
+  '9253': 'https://www.youtube.com/watch?v=27OZc-ku6is', // Steins;Gate
+  '6547': 'https://www.youtube.com/watch?v=GxBj6fptuxY', // Angel Beats!
+  '97940': 'https://www.youtube.com/watch?v=DiUKh_MjsI0', // Made in Abyss
+  '20665': 'https://www.youtube.com/watch?v=3aL0gDZtFbE', // Your Lie in April
+  '21087': 'https://www.youtube.com/watch?v=2JAElThbKrI', // One Punch Man
+  '1': 'https://www.youtube.com/watch?v=RI3zWnlFdLo', // Cowboy Bebop
+  '20954': 'https://www.youtube.com/watch?v=nfK6UgLra7g', // A Silent Voice
+  '21519': 'https://www.youtube.com/watch?v=xU47nhruN-Q', // Your Name
+  '21820': 'https://www.youtube.com/watch?v=ByxQSzf3AQ8', // Spirited Away
+};
+
+// Background colors for placeholder images, indexed by a cheap id-based bucket
+const PLACEHOLDER_COLORS = ['3498db', 'e74c3c', '27ae60', '8e44ad'];
+
+// Provider clients are created on first use and then reused across
+// recommendations and requests, so their response caches and rate limit
+// state are shared instead of starting empty for every anime
+let youtubeClientPromise: Promise<YouTubeClient> | null = null;
+let tmdbClientPromise: Promise<TMDbClient> | null = null;
+
+function getYouTubeClient(): Promise<YouTubeClient> {
+  if (!youtubeClientPromise) {
+    youtubeClientPromise = import('@/app/lib/providers/youtube/client').then(module =>
+      new module.YouTubeClient(process.env.YOUTUBE_API_KEY || '')
+    ).catch(error => {
+      // Allow a later call to retry the import
+      youtubeClientPromise = null;
+      throw error;
+    });
+  }
+  return youtubeClientPromise;
+}
+
+function getTMDbClient(): Promise<TMDbClient> {
+  if (!tmdbClientPromise) {
+    tmdbClientPromise = import('@/app/lib/providers/tmdb/client').then(module =>
+      new module.TMDbClient(process.env.TMDB_API_KEY || '')
+    ).catch(error => {
+      // Allow a later call to retry the import
+      tmdbClientPromise = null;
+      throw error;
+    });
+  }
+  return tmdbClientPromise;
+}
+
+// In-flight YouTube trailer lookups keyed by anime ID. Concurrent requests for
+// the same anime share one lookup; entries are removed once it settles, since
+// the YouTube client already caches trailer results by title
+const trailerLookups: Map<string, Promise<string | null>> = new Map();
+
+function getSharedTrailerLookup(
+  animeId: string,
+  searchTrailer: () => Promise<string | null>
+): Promise<string | null> {
+  const inFlight = trailerLookups.get(animeId);
+  if (inFlight) {
+    return inFlight;
+  }
+
+  const lookup = searchTrailer().finally(() => {
+    trailerLookups.delete(animeId);
+  });
+  trailerLookups.set(animeId, lookup);
+  return lookup;
+}
+
 export async function GET(request: NextRequest): Promise<Response> {
   try {
     console.log("GET /api/v1/recommendations called");
@@ -31,8 +118,7 @@ export async function GET(request: NextRequest): Promise<Response> {
       });
     }
 
-    // Import our debug helper to check localStorage state
-    const { dumpStorage } = await import('@/app/lib/db');
+    // Check localStorage state with our debug helper
     console.log("Recommendations endpoint: Storage state:", dumpStorage());
     
     // Make sure we have a session and profile
@@ -143,16 +229,27 @@ export async function GET(request: NextRequest): Promise<Response> {
             
             // Score the anime based on user profile
             const scoredAnime = animeList.map(anime => {
+              // Map the anime to psychological dimensions once; the result is
+              // reused for explanations if this anime makes the final cut
+              const animeDimensions = mapAnimeToDimensions(anime);
+              
               // Calculate match score based on profile dimensions
               let matchScore = 70; // Default score
               
               if (profile.dimensions && Object.keys(profile.dimensions).length > 0) {
-                matchScore = calculateMatchScore(anime, profile.dimensions);
+                matchScore = calculateMatchScore(animeDimensions, profile.dimensions);
               }
               
-              // Generate match explanations
+              return { anime, animeDimensions, matchScore };
+            });
+            
+            // Take top N recommendations by match score without sorting the full list
+            const topScored = selectTopK(scoredAnime, parseInt(count, 10), scored => scored.matchScore);
+            
+            // Generate match explanations only for the anime we're returning
+            topRecommendations = topScored.map(({ anime, animeDimensions, matchScore }) => {
               const matchExplanations = profile.dimensions ? 
-                getMatchExplanations(anime, profile.dimensions).map(match => match.explanation) : 
+                getMatchExplanations(animeDimensions, profile.dimensions).map(match => match.explanation) : 
                 [
                   'Matches your preferred style',
                   'Aligns with your content preferences',
@@ -166,139 +263,158 @@ export async function GET(request: NextRequest): Promise<Response> {
               };
             });
             
-            // Sort by match score
-            scoredAnime.sort((a, b) => b.matchScore - a.matchScore);
-            
-            // Take top N recommendations
-            topRecommendations = scoredAnime.slice(0, parseInt(count, 10));
-            
             // Format recommendations for frontend
             recommendations = await Promise.all(topRecommendations.map(async (anime) => {
-              // Try to get a trailer if not already present
-              // Start with existing trailer, if available
-              let trailerUrl: string | null | undefined = anime.trailer;
+              // Trailer, TMDb and MAL lookups don't depend on each other, so start
+              // them together rather than waiting on each one in turn
+              const trailerLookup = (async (): Promise<string | null | undefined> => {
+                // Try to get a trailer if not already present
+                // Start with existing trailer, if available
+                let trailerUrl: string | null | undefined = anime.trailer;
               
-              // Add manual trailer mappings for popular anime
-              const manualTrailerMap: Record<string, string> = {
-                '5114': 'https://www.youtube.com/watch?v=--IcmZkvL0Q', // FMA:B
-                '1535': 'https://www.youtube.com/watch?v=NlJZ-YgAt-c', // Death Note
-                '16498': 'https://www.youtube.com/watch?v=MGRm4IzK1SQ', // Attack on Titan
-                '20583': 'https://www.youtube.com/watch?v=vGuQeQsoRgU', // Tokyo Ghoul
-                '11757': 'https://www.youtube.com/watch?v=6ohYYtxfDCg', // Sword Art Online
-                '21856': 'https://www.youtube.com/watch?v=EPVkcwyLQQ8', // My Hero Academia
-                '101922': 'https://www.youtube.com/watch?v=VQGCKyvzIM4', // Demon Slayer
-                '20': 'https://www.youtube.com/watch?v=QczGoCmX-pI', // Naruto
-                '21': 'https://www.youtube.com/watch?v=S8_YwFLCh4U', // One Piece
-                '269': 'https://www.youtube.com/watch?v=0yk5H6vvMEk' // Bleach
-              };
-              
-              // Try manual mapping first
-              const animeIdForTrailer = anime.id?.toString() || '';
-              if (animeIdForTrailer && manualTrailerMap[animeIdForTrailer]) {
-                trailerUrl = manualTrailerMap[animeIdForTrailer];
-                console.log(`Using manual trailer mapping for ${anime.title}: ${trailerUrl}`);
-              }
-              // If no manual mapping and no existing trailer, try API-based lookup
-              else if (!trailerUrl && process.env.YOUTUBE_API_KEY) {
-                try {
-                  console.log(`Searching for trailer for ${anime.title}`);
-                  const youtubeClient = await import('@/app/lib/providers/youtube/client').then(module => 
-                    new module.YouTubeClient(process.env.YOUTUBE_API_KEY || '')
-                  );
-                  
-                  // Use the improved searchAnimeTrailer method first
-                  trailerUrl = await youtubeClient.searchAnimeTrailer(anime.title);
-                  
-                  if (trailerUrl) {
-                    console.log(`Found trailer for ${anime.title}: ${trailerUrl}`);
-                  } else {
-                    console.log(`No trailer found for ${anime.title} using searchAnimeTrailer, trying fallback methods`);
-                  
-                    // If searchAnimeTrailer fails, try searchVideos as backup
-                    // Create a better search query with format information if available
-                    const isMovie = anime.format === 'MOVIE';
-                    const searchQuery = `${anime.title} ${isMovie ? 'movie' : ''} anime trailer official`;
-                    const searchResults = await youtubeClient.searchVideos(searchQuery, 1);
+                // Try manual mapping first
+                const animeIdForTrailer = anime.id?.toString() || '';
+                if (animeIdForTrailer && POPULAR_TRAILER_MAP[animeIdForTrailer]) {
+                  trailerUrl = POPULAR_TRAILER_MAP[animeIdForTrailer];
+                  console.log(`Using manual trailer mapping for ${anime.title}: ${trailerUrl}`);
+                }
+                // If no manual mapping and no existing trailer, try API-based lookup
+                else if (!trailerUrl && process.env.YOUTUBE_API_KEY) {
+                  try {
+                    const searchTrailer = async (): Promise<string | null> => {
+                      console.log(`Searching for trailer for ${anime.title}`);
+                      const youtubeClient = await getYouTubeClient();
+                      
+                      // Use the improved searchAnimeTrailer method first
+                      let foundUrl = await youtubeClient.searchAnimeTrailer(anime.title);
+                      
+                      if (foundUrl) {
+                        console.log(`Found trailer for ${anime.title}: ${foundUrl}`);
+                      } else {
+                        console.log(`No trailer found for ${anime.title} using searchAnimeTrailer, trying fallback methods`);
+                      
+                        // If searchAnimeTrailer fails, try searchVideos as backup
+                        // Create a better search query with format information if available
+                        const isMovie = anime.format === 'MOVIE';
+                        const searchQuery = `${anime.title} ${isMovie ? 'movie' : ''} anime trailer official`;
+                        const searchResults = await youtubeClient.searchVideos(searchQuery, 1);
+                        
+                        if (searchResults?.data && searchResults.data.length > 0) {
+                          const videoItem = searchResults.data[0];
+                          // Handle the case where id can be a string or VideoId object
+                          const videoId = typeof videoItem.id === 'string' ? 
+                                         videoItem.id : 
+                                         (videoItem.id as VideoId).videoId;
+                          foundUrl = `https://www.youtube.com/watch?v=${videoId}`;
+                          console.log(`Found trailer for ${anime.title} via fallback: ${foundUrl}`);
+                        } else {
+                          console.log(`No YouTube results found for ${anime.title} - this is expected for some anime`);
+                        }
+                      }
+                      
+                      return foundUrl;
+                    };
                     
-                    if (searchResults?.data && searchResults.data.length > 0) {
-                      const videoItem = searchResults.data[0];
-                      // Handle the case where id can be a string or VideoId object
-                      const videoId = typeof videoItem.id === 'string' ? 
-                                     videoItem.id : 
-                                     (videoItem.id as VideoId).videoId;
-                      trailerUrl = `https://www.youtube.com/watch?v=${videoId}`;
-                      console.log(`Found trailer for ${anime.title} via fallback: ${trailerUrl}`);
-                    } else {
-                      console.log(`No YouTube results found for ${anime.title} - this is expected for some anime`);
-                    }
+                    trailerUrl = animeIdForTrailer
+                      ? await getSharedTrailerLookup(animeIdForTrailer, searchTrailer)
+                      : await searchTrailer();
+                  } catch (error) {
+                    console.error(`Error getting trailer for ${anime.title}:`, error);
                   }
-                } catch (error) {
-                  console.error(`Error getting trailer for ${anime.title}:`, error);
                 }
-              }
+                
+                return trailerUrl;
+              })();
               
               // Start with AniList images, but we'll prioritize TMDb images when available
               let anilistImage = anime.image?.extraLarge || anime.image?.large || anime.imageUrl || anime.image?.medium;
               console.log(`AniList image for ${anime.title}: ${anilistImage}`);
               
-              let bestImage = anilistImage; // Default to AniList image unless we find better
-              let tmdbScore = null;
-              let tmdbId = null;
+              const tmdbLookup = (async () => {
+                let bestImage = anilistImage; // Default to AniList image unless we find better
+                let tmdbScore = null;
+                let tmdbId = null;
               
-              if (anime.id && process.env.TMDB_API_KEY) {
-                try {
-                  // First try to get accurate TMDB ID using MALSync client
-                  tmdbId = await malSyncClient.getTmdbIdFromAnilist(anime.id);
-                  
-                  if (tmdbId) {
-                    console.log(`Found TMDB ID ${tmdbId} for anime ${anime.title} (ID: ${anime.id}) using MALSync`);
-                    
-                    // Store the mapping in the anime object for future use
-                    if (!anime.externalIds) {
-                      anime.externalIds = {};
-                    }
-                    anime.externalIds.tmdb = tmdbId;
-                    
-                    // Import TMDb client
-                    const TMDbClient = await import('@/app/lib/providers/tmdb/client').then(module => 
-                      new module.TMDbClient(process.env.TMDB_API_KEY || '')
-                    );
-                    
-                    // Get details directly using the TMDB ID (more accurate than search)
-                    const detailsResponse = await TMDbClient.getTVDetails(tmdbId);
+                if (anime.id && process.env.TMDB_API_KEY) {
+                  try {
+                    // First try to get accurate TMDB ID using MALSync client
+                    tmdbId = await malSyncClient.getTmdbIdFromAnilist(anime.id);
                     
-                    if (detailsResponse?.data) {
-                      // Get TMDb score
-                      if (detailsResponse.data.vote_average) {
-                        tmdbScore = detailsResponse.data.vote_average;
-                        console.log(`Found TMDb score for ${anime.title}: ${tmdbScore}`);
+                    if (tmdbId) {
+                      console.log(`Found TMDB ID ${tmdbId} for anime ${anime.title} (ID: ${anime.id}) using MALSync`);
+                      
+                      // Store the mapping in the anime object for future use
+                      if (!anime.externalIds) {
+                        anime.externalIds = {};
                       }
+                      anime.externalIds.tmdb = tmdbId;
                       
-                      // Use TMDb original size image if available
-                      if (detailsResponse.data.poster_path) {
-                        const tmdbImage = `https://image.tmdb.org/t/p/original${detailsResponse.data.poster_path}`;
-                        console.log(`Found higher quality TMDb image for ${anime.title}: ${tmdbImage}`);
-                        bestImage = tmdbImage; // Always prefer TMDb images when available
+                      const TMDbClient = await getTMDbClient();
+                      
+                      // Get details directly using the TMDB ID (more accurate than search)
+                      const detailsResponse = await TMDbClient.getTVDetails(tmdbId);
+                      
+                      if (detailsResponse?.data) {
+                        // Get TMDb score
+                        if (detailsResponse.data.vote_average) {
+                          tmdbScore = detailsResponse.data.vote_average;
+                          console.log(`Found TMDb score for ${anime.title}: ${tmdbScore}`);
+                        }
+                        
+                        // Use TMDb original size image if available
+                        if (detailsResponse.data.poster_path) {
+                          const tmdbImage = `https://image.tmdb.org/t/p/original${detailsResponse.data.poster_path}`;
+                          console.log(`Found higher quality TMDb image for ${anime.title}: ${tmdbImage}`);
+                          bestImage = tmdbImage; // Always prefer TMDb images when available
+                        } else {
+                          console.log(`No poster image found in TMDb for ${anime.title}, using AniList image`);
+                        }
                       } else {
-                        console.log(`No poster image found in TMDb for ${anime.title}, using AniList image`);
+                        console.log(`No data returned from TMDb for ${anime.title}`);
                       }
                     } else {
-                      console.log(`No data returned from TMDb for ${anime.title}`);
+                      console.log(`No TMDB ID found for ${anime.title} (ID: ${anime.id}) in MALSync, falling back to search`);
+                      
+                      // Fallback to search by title if no ID mapping found
+                      const TMDbClient = await getTMDbClient();
+                      
+                      // Determine if this is a movie or TV show (if possible)
+                      // AniList format can tell us this
+                      const isMovie = anime.format === 'MOVIE';
+                      
+                      // Search for anime on TMDb with improved anime search
+                      const searchResponse = await TMDbClient.searchAnime(anime.title, 1, isMovie);
+                      
+                      if (searchResponse?.data?.results && searchResponse.data.results.length > 0) {
+                        const firstResult = searchResponse.data.results[0];
+                        
+                        // Get TMDb score
+                        if (firstResult.vote_average) {
+                          tmdbScore = firstResult.vote_average;
+                        }
+                        
+                        // Use TMDb original size image if available
+                        if (firstResult.poster_path) {
+                          const tmdbImage = `https://image.tmdb.org/t/p/original${firstResult.poster_path}`;
+                          console.log(`Found higher quality TMDb image for ${anime.title} through search`);
+                          bestImage = tmdbImage; // Prefer TMDb images even when found through search
+                        }
+                      }
                     }
-                  } else {
-                    console.log(`No TMDB ID found for ${anime.title} (ID: ${anime.id}) in MALSync, falling back to search`);
-                    
-                    // Fallback to search by title if no ID mapping found
-                    // Import TMDb client
-                    const TMDbClient = await import('@/app/lib/providers/tmdb/client').then(module => 
-                      new module.TMDbClient(process.env.TMDB_API_KEY || '')
-                    );
+                  } catch (tmdbError) {
+                    console.error(`Error getting TMDb data for ${anime.title}:`, tmdbError);
+                    // Continue with AniList image as fallback
+                    bestImage = anilistImage;
+                  }
+                } else if (anime.title && process.env.TMDB_API_KEY) {
+                  // Fallback to title search if no AniList ID available
+                  try {
+                    const TMDbClient = await getTMDbClient();
                     
-                    // Determine if this is a movie or TV show (if possible)
-                    // AniList format can tell us this
-                    const isMovie = anime.format === 'MOVIE';
+                    // Determine if this is a movie or TV show (based on duration or other hints)
+                    const isMovie = false; // Default to TV series if unknown
                     
-                    // Search for anime on TMDb with improved anime search
+                    // Use our improved anime search that handles movies properly
                     const searchResponse = await TMDbClient.searchAnime(anime.title, 1, isMovie);
                     
                     if (searchResponse?.data?.results && searchResponse.data.results.length > 0) {
@@ -312,86 +428,64 @@ export async function GET(request: NextRequest): Promise<Response> {
                       // Use TMDb original size image if available
                       if (firstResult.poster_path) {
                         const tmdbImage = `https://image.tmdb.org/t/p/original${firstResult.poster_path}`;
-                        console.log(`Found higher quality TMDb image for ${anime.title} through search`);
-                        bestImage = tmdbImage; // Prefer TMDb images even when found through search
+                        console.log(`Found higher quality TMDb image for ${anime.title}`);
+                        bestImage = tmdbImage; // Always prefer TMDb images when available
                       }
                     }
+                  } catch (tmdbError) {
+                    console.error(`Error getting TMDb data for ${anime.title}:`, tmdbError);
+                    // Continue with AniList image as fallback
+                    bestImage = anilistImage;
                   }
-                } catch (tmdbError) {
-                  console.error(`Error getting TMDb data for ${anime.title}:`, tmdbError);
-                  // Continue with AniList image as fallback
-                  bestImage = anilistImage;
                 }
-              } else if (anime.title && process.env.TMDB_API_KEY) {
-                // Fallback to title search if no AniList ID available
-                try {
-                  // Import TMDb client
-                  const TMDbClient = await import('@/app/lib/providers/tmdb/client').then(module => 
-                    new module.TMDbClient(process.env.TMDB_API_KEY || '')
-                  );
-                  
-                  // Determine if this is a movie or TV show (based on duration or other hints)
-                  const isMovie = false; // Default to TV series if unknown
-                  
-                  // Use our improved anime search that handles movies properly
-                  const searchResponse = await TMDbClient.searchAnime(anime.title, 1, isMovie);
-                  
-                  if (searchResponse?.data?.results && searchResponse.data.results.length > 0) {
-                    const firstResult = searchResponse.data.results[0];
-                    
-                    // Get TMDb score
-                    if (firstResult.vote_average) {
-                      tmdbScore = firstResult.vote_average;
-                    }
+                
+                return { bestImage, tmdbScore };
+              })();
+              
+              // Try to find MAL ID
+              const malLookup = (async () => {
+                let malId = null;
+                
+                // Get MAL ID from AniList ID using MALSync
+                if (anime.id) {
+                  try {
+                    malId = await malSyncClient.getMalIdFromAnilist(anime.id);
                     
-                    // Use TMDb original size image if available
-                    if (firstResult.poster_path) {
-                      const tmdbImage = `https://image.tmdb.org/t/p/original${firstResult.poster_path}`;
-                      console.log(`Found higher quality TMDb image for ${anime.title}`);
-                      bestImage = tmdbImage; // Always prefer TMDb images when available
+                    if (malId) {
+                      console.log(`Found MAL ID ${malId} for anime ${anime.title} (ID: ${anime.id}) using MALSync`);
+                      
+                      // Store the MAL ID for future use
+                      if (!anime.externalIds) {
+                        anime.externalIds = {};
+                      }
+                      anime.externalIds.mal = malId;
+                      
+                      // We could fetch the MAL score here if we implement MAL API integration
+                      // For now, we'll just store the ID for future use
+                      
+                      // Example of how MAL API integration would work:
+                      // const MALClient = await import('@/app/lib/providers/mal/client').then(module => 
+                      //   new module.MALClient(process.env.MAL_CLIENT_ID || '')
+                      // );
+                      // const malAnime = await MALClient.getAnime(malId);
+                      // if (malAnime?.data?.mean) {
+                      //   malScore = malAnime.data.mean;
+                      // }
                     }
+                  } catch (malError) {
+                    console.error(`Error getting MAL ID for ${anime.title}:`, malError);
                   }
-                } catch (tmdbError) {
-                  console.error(`Error getting TMDb data for ${anime.title}:`, tmdbError);
-                  // Continue with AniList image as fallback
-                  bestImage = anilistImage;
                 }
-              }
+              })();
               
-              // Try to find MAL score and ID
-              let malScore = null;
-              let malId = null;
+              const [trailerUrl, { bestImage, tmdbScore }] = await Promise.all([
+                trailerLookup,
+                tmdbLookup,
+                malLookup
+              ]);
               
-              // Get MAL ID from AniList ID using MALSync
-              if (anime.id) {
-                try {
-                  malId = await malSyncClient.getMalIdFromAnilist(anime.id);
-                  
-                  if (malId) {
-                    console.log(`Found MAL ID ${malId} for anime ${anime.title} (ID: ${anime.id}) using MALSync`);
-                    
-                    // Store the MAL ID for future use
-                    if (!anime.externalIds) {
-                      anime.externalIds = {};
-                    }
-                    anime.externalIds.mal = malId;
-                    
-                    // We could fetch the MAL score here if we implement MAL API integration
-                    // For now, we'll just store the ID for future use
-                    
-                    // Example of how MAL API integration would work:
-                    // const MALClient = await import('@/app/lib/providers/mal/client').then(module => 
-                    //   new module.MALClient(process.env.MAL_CLIENT_ID || '')
-                    // );
-                    // const malAnime = await MALClient.getAnime(malId);
-                    // if (malAnime?.data?.mean) {
-                    //   malScore = malAnime.data.mean;
-                    // }
-                  }
-                } catch (malError) {
-                  console.error(`Error getting MAL ID for ${anime.title}:`, malError);
-                }
-              }
+              // We don't fetch MAL scores yet
+              let malScore = null;
               
               // Create scores object with available scores
               const scores = {} as Record<string, number>;
@@ -426,7 +520,7 @@ export async function GET(request: NextRequest): Promise<Response> {
                 } else {
                   // Fallback to placeholder with color based on anime ID for consistency
                   const colorIndex = anime.id ? anime.id.toString().charCodeAt(0) % 4 : Math.floor(Math.random() * 4);
-                  finalImage = `https://dummyimage.com/600x900/${['3498db', 'e74c3c', '27ae60', '8e44ad'][colorIndex]}/ffffff&text=${encodeURIComponent(anime.title || 'Anime')}`;
+                  finalImage = `https://dummyimage.com/600x900/${PLACEHOLDER_COLORS[colorIndex]}/ffffff&text=${encodeURIComponent(anime.title || 'Anime')}`;
                 }
               }
               // Handle case where we don't have an ID
@@ -437,7 +531,7 @@ export async function GET(request: NextRequest): Promise<Response> {
               } else {
                 // Fallback to placeholder with random color
                 const colorIndex = Math.floor(Math.random() * 4);
-                finalImage = `https://dummyimage.com/600x900/${['3498db', 'e74c3c', '27ae60', '8e44ad'][colorIndex]}/ffffff&text=${encodeURIComponent(anime.title || 'Anime')}`;
+                finalImage = `https://dummyimage.com/600x900/${PLACEHOLDER_COLORS[colorIndex]}/ffffff&text=${encodeURIComponent(anime.title || 'Anime')}`;
               }
               
               console.log(`Final image selected for ${anime.title}: ${finalImage}`);
@@ -528,45 +622,38 @@ export async function GET(request: NextRequest): Promise<Response> {
   }
 }
 
+// Lowercased manual mapping titles paired with their trailer URLs, built on
+// first use so title matching doesn't lowercase every title on every call
+let trailerTitles: Array<[string, string]> | null = null;
+
+function getTrailerTitles(): Array<[string, string]> {
+  if (!trailerTitles) {
+    trailerTitles = [];
+    for (const [id, trailerUrl] of Object.entries(MANUAL_TRAILER_MAP)) {
+      const mapping = manualMappings[id];
+      if (mapping && mapping.title) {
+        trailerTitles.push([mapping.title.toLowerCase(), trailerUrl]);
+      }
+    }
+  }
+  return trailerTitles;
+}
+
 // Helper function to get trailer URLs for popular anime
 function getTrailerForAnime(animeId: string | undefined, title: string | undefined): string | undefined {
   if (!animeId && !title) return undefined;
   
-  // Manual trailer mapping for popular anime
-  const trailerMap: Record<string, string> = {
-    '5114': 'https://www.youtube.com/watch?v=--IcmZkvL0Q', // FMA:B
-    '1535': 'https://www.youtube.com/watch?v=NlJZ-YgAt-c', // Death Note
-    '16498': 'https://www.youtube.com/watch?v=MGRm4IzK1SQ', // Attack on Titan
-    '20583': 'https://www.youtube.com/watch?v=vGuQeQsoRgU', // Tokyo Ghoul 
-    '11757': 'https://www.youtube.com/watch?v=6ohYYtxfDCg', // Sword Art Online
-    '21856': 'https://www.youtube.com/watch?v=EPVkcwyLQQ8', // My Hero Academia
-    '101922': 'https://www.youtube.com/watch?v=VQGCKyvzIM4', // Demon Slayer
-    '20': 'https://www.youtube.com/watch?v=QczGoCmX-pI', // Naruto
-    '21': 'https://www.youtube.com/watch?v=S8_YwFLCh4U', // One Piece
-    '269': 'https://www.youtube.com/watch?v=0yk5H6vvMEk', // Bleach
-    '9253': 'https://www.youtube.com/watch?v=27OZc-ku6is', // Steins;Gate
-    '6547': 'https://www.youtube.com/watch?v=GxBj6fptuxY', // Angel Beats!
-    '97940': 'https://www.youtube.com/watch?v=DiUKh_MjsI0', // Made in Abyss
-    '20665': 'https://www.youtube.com/watch?v=3aL0gDZtFbE', // Your Lie in April
-    '21087': 'https://www.youtube.com/watch?v=2JAElThbKrI', // One Punch Man
-    '1': 'https://www.youtube.com/watch?v=RI3zWnlFdLo', // Cowboy Bebop
-    '20954': 'https://www.youtube.com/watch?v=nfK6UgLra7g', // A Silent Voice
-    '21519': 'https://www.youtube.com/watch?v=xU47nhruN-Q', // Your Name
-    '21820': 'https://www.youtube.com/watch?v=ByxQSzf3AQ8', // Spirited Away
-  };
-  
   // Try to find by ID first
-  if (animeId && trailerMap[animeId]) {
-    return trailerMap[animeId];
+  if (animeId && MANUAL_TRAILER_MAP[animeId]) {
+    return MANUAL_TRAILER_MAP[animeId];
   }
   
   // If no match by ID but we have title, try to find a partial match
   // (for generated recommendations without exact ID)
   if (title && title.length > 0) {
     const lowerTitle = title.toLowerCase();
-    for (const [id, trailerUrl] of Object.entries(trailerMap)) {
-      const mapping = manualMappings[id];
-      if (mapping && mapping.title && mapping.title.toLowerCase().includes(lowerTitle)) {
+    for (const [mappingTitle, trailerUrl] of getTrailerTitles()) {
+      if (mappingTitle.includes(lowerTitle)) {
         return trailerUrl;
       }
     }
@@ -576,6 +663,24 @@ function getTrailerForAnime(animeId: string | undefined, title: string | undefin
   return undefined;
 }
 
+// Manual mapping IDs keyed by lowercased title, built on first use so title
+// matching doesn't lowercase every mapping title for every recommendation
+let manualMappingIdsByTitle: Map<string, string> | null = null;
+
+function getManualMappingIdsByTitle(): Map<string, string> {
+  if (!manualMappingIdsByTitle) {
+    manualMappingIdsByTitle = new Map();
+    for (const [id, mapping] of Object.entries(manualMappings)) {
+      const lowerTitle = mapping.title.toLowerCase();
+      // Keep the first mapping for a title, as the linear search did
+      if (!manualMappingIdsByTitle.has(lowerTitle)) {
+        manualMappingIdsByTitle.set(lowerTitle, id);
+      }
+    }
+  }
+  return manualMappingIdsByTitle;
+}
+
 // Force manual mappings to be used for all recommendations
 function forceManualMappingsForRecommendations(recommendations: any[]): any[] {
   if (!recommendations || recommendations.length === 0) {
@@ -597,13 +702,10 @@ function forceManualMappingsForRecommendations(recommendations: any[]): any[] {
     }
     // Try title-based match
     else if (rec.title) {
-      const lowerTitle = rec.title.toLowerCase();
-      for (const [id, mapping] of Object.entries(manualMappings)) {
-        if (mapping.title.toLowerCase() === lowerTitle) {
-          matchingId = id;
-          matchingMapping = mapping;
-          break;
-        }
+      const id = getManualMappingIdsByTitle().get(rec.title.toLowerCase());
+      if (id) {
+        matchingId = id;
+        matchingMapping = manualMappings[id];
       }
     }
     
@@ -625,9 +727,6 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
   console.log("Using mock recommendations function with profile:", profile?.dimensions);
   console.log("Requested count:", count);
   
-  // Import our mapping function directly
-  const { getImageUrlFromManualMapping } = require('@/app/lib/utils/malsync/manual-mappings');
-  
   // Create a selection of high-quality anime recommendations
   const animeDatabase = [
     {
@@ -872,46 +971,54 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
   let animeList: MockAnimeEntry[] = [];
   
   try {
+    // Calculate distance between profile and anime traits using a more sophisticated approach
+    // Define the dimension keys with a type to help TypeScript understand they are valid keys
+    const dimensions = [
+      'visualComplexity',
+      'narrativeComplexity',
+      'emotionalIntensity',
+      'characterComplexity',
+      'moralAmbiguity'
+    ] as const;
+    
+    // Define the dimension key type for type safety
+    type DimensionKey = typeof dimensions[number];
+    
+    // Dimension importance weights - critical improvement
+    const dimensionWeights: Record<string, number> = {
+      'visualComplexity': 0.8,
+      'narrativeComplexity': 1.0,
+      'emotionalIntensity': 0.9,
+      'characterComplexity': 1.0,
+      'moralAmbiguity': 0.7
+    };
+    
+    // Per-anime and per-dimension scoring logs are only formatted when debugging
+    const DEBUG = process.env.DEBUG_RECOMMENDATIONS === 'true';
+    
+    // These only depend on the profile, so check them once rather than per anime
+    const hasProfileDimensions = !!profile?.dimensions && Object.keys(profile.dimensions).length > 0;
+    
     // Calculate match scores based on profile dimensions
     const scoredAnime = animeDatabase.map(anime => {
       // If profile is null or has no dimensions, use a random score
-      if (!profile || !profile.dimensions || Object.keys(profile.dimensions).length === 0) {
+      if (!hasProfileDimensions) {
         return {
           ...anime,
           matchScore: Math.floor(70 + Math.random() * 30)
         };
       }
       
-      // Calculate distance between profile and anime traits using a more sophisticated approach
-      // Define the dimension keys with a type to help TypeScript understand they are valid keys
-      const dimensions = [
-        'visualComplexity',
-        'narrativeComplexity',
-        'emotionalIntensity',
-        'characterComplexity',
-        'moralAmbiguity'
-      ] as const;
-      
-      // Define the dimension key type for type safety
-      type DimensionKey = typeof dimensions[number];
-      
-      // Dimension importance weights - critical improvement
-      const dimensionWeights: Record<string, number> = {
-        'visualComplexity': 0.8,
-        'narrativeComplexity': 1.0,
-        'emotionalIntensity': 0.9,
-        'characterComplexity': 1.0,
-        'moralAmbiguity': 0.7
-      };
-      
       let weightedDistanceSum = 0;
       let totalWeight = 0;
       
       // Log debug info
-      console.log(`Comparing anime "${anime.title}" with profile:`, {
-        animeTraits: anime.traits,
-        profileDimensions: profile!.dimensions
-      });
+      if (DEBUG) {
+        console.log(`Comparing anime "${anime.title}" with profile:`, {
+          animeTraits: anime.traits,
+          profileDimensions: profile!.dimensions
+        });
+      }
       
       dimensions.forEach(dim => {
         // Now TypeScript knows dim is a valid key
@@ -922,7 +1029,8 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
           const animeValue = anime.traits[dimKey];
           
           // Calculate distance (squared to emphasize larger differences)
-          const distance = Math.pow(Math.abs(profileValue - animeValue), 2) / 100;
+          const difference = profileValue - animeValue;
+          const distance = (difference * difference) / 100;
           
           // Get weight for this dimension
           const weight = dimensionWeights[dimKey] || 1.0;
@@ -931,7 +1039,9 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
           weightedDistanceSum += distance * weight;
           totalWeight += weight;
           
-          console.log(`Dimension ${dimKey}: profile=${profileValue}, anime=${animeValue}, distance=${distance.toFixed(2)}, weight=${weight}`);
+          if (DEBUG) {
+            console.log(`Dimension ${dimKey}: profile=${profileValue}, anime=${animeValue}, distance=${distance.toFixed(2)}, weight=${weight}`);
+          }
         }
       });
       
@@ -940,7 +1050,9 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
       const avgWeightedDistance = totalWeight > 0 ? weightedDistanceSum / totalWeight : 0.5;
       const matchScore = Math.max(0, Math.min(100, 100 - (avgWeightedDistance * 100)));
       
-      console.log(`Final match score for ${anime.title}: ${matchScore.toFixed(1)}%`);
+      if (DEBUG) {
+        console.log(`Final match score for ${anime.title}: ${matchScore.toFixed(1)}%`);
+      }
       
       // Add some randomness to prevent identical scores for similar anime
       const finalScore = Math.round(matchScore + (Math.random() * 3 - 1.5));
@@ -951,11 +1063,8 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
       };
     });
     
-    // Sort by match score (descending)
-    scoredAnime.sort((a, b) => b.matchScore - a.matchScore);
-    
-    // Get more items than needed for randomization
-    const candidateList = scoredAnime.slice(0, count * 3);
+    // Get more items than needed for randomization, best match scores first
+    const candidateList = selectTopK(scoredAnime, count * 3, scored => scored.matchScore);
     
     // Add some randomization to prevent always showing the same recommendations
     // But reduce the randomization to let the profile matching dominate
@@ -1206,7 +1315,7 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
                   : (anime.image?.medium && anime.image?.medium.startsWith('http'))
                     ? anime.image.medium 
                     // Fallback to your colorful placeholder image
-                    : `https://dummyimage.com/600x900/${['3498db', 'e74c3c', '27ae60', '8e44ad'][index % 4]}/ffffff&text=${encodeURIComponent(anime.title || 'Anime')}`;
+                    : `https://dummyimage.com/600x900/${PLACEHOLDER_COLORS[index % 4]}/ffffff&text=${encodeURIComponent(anime.title || 'Anime')}`;
     }
 
     return {
@@ -1252,7 +1361,7 @@ function useMockRecommendations(profile: Profile | null, count: number): { recom
     
     // Use the same image from our mapping
     const imageUrl = randomAnimeBase.imageUrl || 
-                     `https://dummyimage.com/600x900/${['3498db', 'e74c3c', '27ae60', '8e44ad'][index % 4]}/ffffff&text=${encodeURIComponent(randomTitle)}`;
+                     `https://dummyimage.com/600x900/${PLACEHOLDER_COLORS[index % 4]}/ffffff&text=${encodeURIComponent(randomTitle)}`;
     
     recommendations.push({
       id: `mock-${index}`,
@@ -1,7 +1,7 @@
 'use client';
 
 import { motion } from 'framer-motion';
-import { useState } from 'react';
+import { useMemo, useState } from 'react';
 
 export interface AnimeRecommendation {
   id: string;
@@ -36,6 +36,12 @@ interface AnimeCardProps {
 export default function AnimeCard({ anime, index }: AnimeCardProps) {
   const [isExpanded, setIsExpanded] = useState(false);
 
+  // Strip HTML tags once per synopsis instead of on every render
+  const plainSynopsis = useMemo(
+    () => (anime.synopsis ? anime.synopsis.replace(/<[^>]*>/g, '') : ''),
+    [anime.synopsis]
+  );
+
   // Stagger animation for cards
   const cardVariants = {
     hidden: { opacity: 0, y: 20 },
@@ -189,7 +195,7 @@ export default function AnimeCard({ anime, index }: AnimeCardProps) {
 
         <div className="mb-4">
           <p className="text-sm text-gray-700 line-clamp-2">
-            {anime.synopsis ? anime.synopsis.replace(/<[^>]*>/g, '') : ''}
+            {plainSynopsis}
           </p>
           {anime.synopsis.length > 100 && (
             <button
@@ -264,7 +270,7 @@ export default function AnimeCard({ anime, index }: AnimeCardProps) {
           animate={{ opacity: 1, height: 'auto' }}
         >
           <div className="text-sm text-gray-700">
-            {anime.synopsis ? anime.synopsis.replace(/<[^>]*>/g, '') : ''}
+            {plainSynopsis}
           </div>
         </motion.div>
       )}
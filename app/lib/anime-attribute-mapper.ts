@@ -212,34 +212,155 @@ const popularityToDimensionMapping = (popularity?: number): Record<string, numbe
 };
 
 // Season to color mapping - different seasons have different visual tones
+// Keyed by lowercase season name so lookups are a single property access
+const seasonDimensionMappings: Record<string, Record<string, number>> = {
+  'winter': {
+    colorSaturation: 4,
+    emotionalValence: -1
+  },
+  'spring': {
+    colorSaturation: 7,
+    emotionalValence: 2
+  },
+  'summer': {
+    colorSaturation: 8,
+    emotionalValence: 3
+  },
+  'fall': {
+    colorSaturation: 6,
+    emotionalValence: 0
+  }
+};
+
 const seasonToDimensionMapping = (season?: string): Record<string, number> => {
   if (!season) return {};
 
-  const seasonLower = season.toLowerCase();
+  return seasonDimensionMappings[season.toLowerCase()] || {};
+};
 
-  if (seasonLower === 'winter') {
-    return {
-      colorSaturation: 4,
-      emotionalValence: -1
-    };
-  } else if (seasonLower === 'spring') {
-    return {
-      colorSaturation: 7,
-      emotionalValence: 2
-    };
-  } else if (seasonLower === 'summer') {
-    return {
-      colorSaturation: 8,
-      emotionalValence: 3
-    };
-  } else if (seasonLower === 'fall') {
-    return {
-      colorSaturation: 6,
-      emotionalValence: 0
-    };
+// Dimensions on a -5 to 5 scale; all others are on a 0 to 10 scale
+const bipolarDimensions = new Set([
+  'emotionalValence',
+  'fantasyRealism',
+  'intellectualEmotional',
+  'noveltyFamiliarity'
+]);
+
+// Weight factors for different attribute types when mapping to dimensions
+const attributeWeights = {
+  genre: 1.0,
+  studio: 0.8,
+  format: 0.5,
+  status: 0.3,
+  score: 0.6,
+  popularity: 0.4,
+  season: 0.4
+};
+
+// Dimension names in human-readable format
+const dimensionNames: Record<string, string> = {
+  visualComplexity: 'Visual Complexity',
+  colorSaturation: 'Color Vibrancy',
+  visualPace: 'Visual Pacing',
+  narrativeComplexity: 'Story Complexity',
+  narrativePace: 'Narrative Pacing',
+  plotPredictability: 'Plot Predictability',
+  characterComplexity: 'Character Depth',
+  characterGrowth: 'Character Development',
+  emotionalIntensity: 'Emotional Intensity',
+  emotionalValence: 'Emotional Tone',
+  moralAmbiguity: 'Moral Ambiguity',
+  fantasyRealism: 'Fantasy vs. Realism',
+  intellectualEmotional: 'Intellectual Appeal',
+  noveltyFamiliarity: 'Novelty'
+};
+
+// Explanation templates
+const explanationTemplates: Record<string, Array<string>> = {
+  visualComplexity: [
+    'Matches your preference for {value} visual detail and complexity',
+    'The {value} visual style aligns with your preferences'
+  ],
+  colorSaturation: [
+    'Features {value} color palette that suits your taste',
+    'The {value} visual tones match your preferences'
+  ],
+  narrativeComplexity: [
+    'Has a {value} storyline complexity that you tend to enjoy',
+    'Features a {value} narrative structure that matches your preferences'
+  ],
+  characterComplexity: [
+    'Contains {value} characters that match your preference depth',
+    'The {value} character development aligns with your taste'
+  ],
+  emotionalIntensity: [
+    'Delivers {value} emotional impact that resonates with you',
+    'The {value} emotional moments match your preferences'
+  ],
+  fantasyRealism: [
+    'Balances fantasy and realism in a way that appeals to you',
+    'The {value} setting matches your preference for fantasy vs. realism'
+  ]
+};
+
+// Value descriptors
+const getValueDescriptor = (dimension: string, value: number): string => {
+  if (dimension === 'emotionalValence') {
+    if (value > 3) return 'uplifting';
+    if (value > 1) return 'positive';
+    if (value > -1) return 'balanced';
+    if (value > -3) return 'somber';
+    return 'dark';
   }
 
-  return {};
+  if (dimension === 'fantasyRealism') {
+    if (value > 3) return 'highly fantastical';
+    if (value > 1) return 'fantasy-oriented';
+    if (value > -1) return 'balanced';
+    if (value > -3) return 'grounded';
+    return 'highly realistic';
+  }
+
+  if (dimension === 'intellectualEmotional') {
+    if (value > 3) return 'intellectually stimulating';
+    if (value > 1) return 'thought-provoking';
+    if (value > -1) return 'balanced';
+    if (value > -3) return 'emotionally engaging';
+    return 'emotionally powerful';
+  }
+
+  if (dimension === 'noveltyFamiliarity') {
+    if (value > 3) return 'highly innovative';
+    if (value > 1) return 'fresh';
+    if (value > -1) return 'balanced';
+    if (value > -3) return 'comfortably familiar';
+    return 'classic';
+  }
+
+  // For 0-10 scale dimensions
+  if (value >= 8) return 'high';
+  if (value >= 6) return 'moderate';
+  if (value >= 4) return 'balanced';
+  if (value >= 2) return 'subtle';
+  return 'minimal';
+};
+
+// Dimension importance weights
+const dimensionWeights: Record<string, number> = {
+  visualComplexity: 0.8,
+  colorSaturation: 0.6,
+  visualPace: 0.7,
+  narrativeComplexity: 1.0,
+  narrativePace: 0.8,
+  plotPredictability: 0.8,
+  characterComplexity: 1.0,
+  characterGrowth: 0.9,
+  emotionalIntensity: 0.9,
+  emotionalValence: 0.8,
+  moralAmbiguity: 0.7,
+  fantasyRealism: 0.8,
+  intellectualEmotional: 0.8,
+  noveltyFamiliarity: 0.6
 };
 
 /**
@@ -267,17 +388,6 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
     noveltyFamiliarity: 0 // -5 to 5 scale
   };
 
-  // Weight factors for different attribute types
-  const weights = {
-    genre: 1.0,
-    studio: 0.8,
-    format: 0.5,
-    status: 0.3,
-    score: 0.6,
-    popularity: 0.4,
-    season: 0.4
-  };
-
   // Apply genre mappings
   if (anime.genres && anime.genres.length > 0) {
     let genreCount = 0;
@@ -290,7 +400,7 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
         // Apply each dimension mapping with genre weight
         Object.entries(mappings).forEach(([dimension, value]) => {
           if (dimension in dimensions) {
-            dimensions[dimension] += (value - dimensions[dimension]) * weights.genre;
+            dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.genre;
           }
         });
       }
@@ -310,7 +420,7 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
         // Apply each dimension mapping with studio weight
         Object.entries(mappings).forEach(([dimension, value]) => {
           if (dimension in dimensions) {
-            dimensions[dimension] += (value - dimensions[dimension]) * weights.studio;
+            dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.studio;
           }
         });
       }
@@ -323,7 +433,7 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
     if (mappings) {
       Object.entries(mappings).forEach(([dimension, value]) => {
         if (dimension in dimensions) {
-          dimensions[dimension] += (value - dimensions[dimension]) * weights.format;
+          dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.format;
         }
       });
     }
@@ -335,7 +445,7 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
     if (mappings) {
       Object.entries(mappings).forEach(([dimension, value]) => {
         if (dimension in dimensions) {
-          dimensions[dimension] += (value - dimensions[dimension]) * weights.status;
+          dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.status;
         }
       });
     }
@@ -345,7 +455,7 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
   const scoreMappings = scoreToDimensionMapping(anime.score);
   Object.entries(scoreMappings).forEach(([dimension, value]) => {
     if (dimension in dimensions) {
-      dimensions[dimension] += (value - dimensions[dimension]) * weights.score;
+      dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.score;
     }
   });
 
@@ -353,7 +463,7 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
   const popularityMappings = popularityToDimensionMapping(anime.popularity);
   Object.entries(popularityMappings).forEach(([dimension, value]) => {
     if (dimension in dimensions) {
-      dimensions[dimension] += (value - dimensions[dimension]) * weights.popularity;
+      dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.popularity;
     }
   });
 
@@ -361,14 +471,13 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
   const seasonMappings = seasonToDimensionMapping(anime.season);
   Object.entries(seasonMappings).forEach(([dimension, value]) => {
     if (dimension in dimensions) {
-      dimensions[dimension] += (value - dimensions[dimension]) * weights.season;
+      dimensions[dimension] += (value - dimensions[dimension]) * attributeWeights.season;
     }
   });
 
   // Ensure values are within bounds
   Object.entries(dimensions).forEach(([dimension, value]) => {
-    if (dimension === 'emotionalValence' || dimension === 'fantasyRealism' ||
-        dimension === 'intellectualEmotional' || dimension === 'noveltyFamiliarity') {
+    if (bipolarDimensions.has(dimension)) {
       // These dimensions are on a -5 to 5 scale
       dimensions[dimension] = Math.max(-5, Math.min(5, value));
     } else {
@@ -380,107 +489,24 @@ export function mapAnimeToDimensions(anime: AnimeTitle): Record<string, number>
   return dimensions;
 }
 
+// Maximum number of match explanations returned per anime
+const MAX_MATCH_EXPLANATIONS = 3;
+
 /**
  * Get explanation for why an anime matches a user's profile
  *
- * @param anime Anime title
+ * @param anime Anime title or pre-mapped dimensions
  * @param userProfile User's psychological profile
  * @returns Array of explanations for strong matches
  */
 export function getMatchExplanations(
-  anime: AnimeTitle,
+  anime: AnimeTitle | Record<string, number>,
   userProfile: Record<string, number>
 ): Array<{dimension: string, strength: number, explanation: string}> {
-  const animeDimensions = mapAnimeToDimensions(anime);
-  const matches: Array<{dimension: string, strength: number, explanation: string}> = [];
-
-  // Dimension names in human-readable format
-  const dimensionNames: Record<string, string> = {
-    visualComplexity: 'Visual Complexity',
-    colorSaturation: 'Color Vibrancy',
-    visualPace: 'Visual Pacing',
-    narrativeComplexity: 'Story Complexity',
-    narrativePace: 'Narrative Pacing',
-    plotPredictability: 'Plot Predictability',
-    characterComplexity: 'Character Depth',
-    characterGrowth: 'Character Development',
-    emotionalIntensity: 'Emotional Intensity',
-    emotionalValence: 'Emotional Tone',
-    moralAmbiguity: 'Moral Ambiguity',
-    fantasyRealism: 'Fantasy vs. Realism',
-    intellectualEmotional: 'Intellectual Appeal',
-    noveltyFamiliarity: 'Novelty'
-  };
-
-  // Explanation templates
-  const explanationTemplates: Record<string, Array<string>> = {
-    visualComplexity: [
-      'Matches your preference for {value} visual detail and complexity',
-      'The {value} visual style aligns with your preferences'
-    ],
-    colorSaturation: [
-      'Features {value} color palette that suits your taste',
-      'The {value} visual tones match your preferences'
-    ],
-    narrativeComplexity: [
-      'Has a {value} storyline complexity that you tend to enjoy',
-      'Features a {value} narrative structure that matches your preferences'
-    ],
-    characterComplexity: [
-      'Contains {value} characters that match your preference depth',
-      'The {value} character development aligns with your taste'
-    ],
-    emotionalIntensity: [
-      'Delivers {value} emotional impact that resonates with you',
-      'The {value} emotional moments match your preferences'
-    ],
-    fantasyRealism: [
-      'Balances fantasy and realism in a way that appeals to you',
-      'The {value} setting matches your preference for fantasy vs. realism'
-    ]
-  };
-
-  // Value descriptors
-  const getValueDescriptor = (dimension: string, value: number): string => {
-    if (dimension === 'emotionalValence') {
-      if (value > 3) return 'uplifting';
-      if (value > 1) return 'positive';
-      if (value > -1) return 'balanced';
-      if (value > -3) return 'somber';
-      return 'dark';
-    }
-
-    if (dimension === 'fantasyRealism') {
-      if (value > 3) return 'highly fantastical';
-      if (value > 1) return 'fantasy-oriented';
-      if (value > -1) return 'balanced';
-      if (value > -3) return 'grounded';
-      return 'highly realistic';
-    }
-
-    if (dimension === 'intellectualEmotional') {
-      if (value > 3) return 'intellectually stimulating';
-      if (value > 1) return 'thought-provoking';
-      if (value > -1) return 'balanced';
-      if (value > -3) return 'emotionally engaging';
-      return 'emotionally powerful';
-    }
-
-    if (dimension === 'noveltyFamiliarity') {
-      if (value > 3) return 'highly innovative';
-      if (value > 1) return 'fresh';
-      if (value > -1) return 'balanced';
-      if (value > -3) return 'comfortably familiar';
-      return 'classic';
-    }
-
-    // For 0-10 scale dimensions
-    if (value >= 8) return 'high';
-    if (value >= 6) return 'moderate';
-    if (value >= 4) return 'balanced';
-    if (value >= 2) return 'subtle';
-    return 'minimal';
-  };
+  // Get anime dimensions if not already provided
+  const animeDimensions = 'title' in anime ? mapAnimeToDimensions(anime as AnimeTitle) : anime as Record<string, number>;
+  // Strongest matches so far, highest first, capped at MAX_MATCH_EXPLANATIONS
+  const topMatches: Array<{dimension: string, strength: number, animeValue: number}> = [];
 
   // Calculate match strength for each dimension
   Object.entries(userProfile).forEach(([dimension, userValue]) => {
@@ -490,8 +516,7 @@ export function getMatchExplanations(
       // Calculate how close the anime is to user's preference
       let similarity: number;
 
-      if (dimension === 'emotionalValence' || dimension === 'fantasyRealism' ||
-          dimension === 'intellectualEmotional' || dimension === 'noveltyFamiliarity') {
+      if (bipolarDimensions.has(dimension)) {
         // For -5 to 5 scale, normalize distance to 0-1
         similarity = 1 - (Math.abs(userValue - animeValue) / 10);
       } else {
@@ -499,32 +524,40 @@ export function getMatchExplanations(
         similarity = 1 - (Math.abs(userValue - animeValue) / 10);
       }
 
-      // Only include strong matches
-      if (similarity >= 0.8) {
-        const descriptor = getValueDescriptor(dimension, animeValue);
-
-        // Get a random explanation template
-        const templates = explanationTemplates[dimension] || [
-          `Matches your preference for ${dimensionNames[dimension] || dimension}`
-        ];
-        const template = templates[Math.floor(Math.random() * templates.length)];
-
-        const explanation = template.replace('{value}', descriptor);
-
-        matches.push({
-          dimension,
-          strength: similarity,
-          explanation
-        });
+      // Only include strong matches, and only if they beat the weakest one kept.
+      // Ties keep the earlier dimension, the same order a stable sort gives
+      if (similarity >= 0.8 && (
+        topMatches.length < MAX_MATCH_EXPLANATIONS ||
+        similarity > topMatches[topMatches.length - 1].strength
+      )) {
+        let insertAt = topMatches.length;
+        while (insertAt > 0 && topMatches[insertAt - 1].strength < similarity) {
+          insertAt--;
+        }
+        topMatches.splice(insertAt, 0, { dimension, strength: similarity, animeValue });
+        if (topMatches.length > MAX_MATCH_EXPLANATIONS) {
+          topMatches.pop();
+        }
       }
     }
   });
 
-  // Sort by match strength (highest first)
-  matches.sort((a, b) => b.strength - a.strength);
+  // Only build explanation text for the matches that are returned
+  return topMatches.map(({ dimension, strength, animeValue }) => {
+    const descriptor = getValueDescriptor(dimension, animeValue);
 
-  // Return top matches
-  return matches.slice(0, 3);
+    // Get a random explanation template
+    const templates = explanationTemplates[dimension] || [
+      `Matches your preference for ${dimensionNames[dimension] || dimension}`
+    ];
+    const template = templates[Math.floor(Math.random() * templates.length)];
+
+    return {
+      dimension,
+      strength,
+      explanation: template.replace('{value}', descriptor)
+    };
+  });
 }
 
 /**
@@ -541,24 +574,6 @@ export function calculateMatchScore(
   // Get anime dimensions if not already provided
   const animeDimensions = 'title' in anime ? mapAnimeToDimensions(anime as AnimeTitle) : anime;
 
-  // Dimension importance weights
-  const dimensionWeights: Record<string, number> = {
-    visualComplexity: 0.8,
-    colorSaturation: 0.6,
-    visualPace: 0.7,
-    narrativeComplexity: 1.0,
-    narrativePace: 0.8,
-    plotPredictability: 0.8,
-    characterComplexity: 1.0,
-    characterGrowth: 0.9,
-    emotionalIntensity: 0.9,
-    emotionalValence: 0.8,
-    moralAmbiguity: 0.7,
-    fantasyRealism: 0.8,
-    intellectualEmotional: 0.8,
-    noveltyFamiliarity: 0.6
-  };
-
   let totalWeight = 0;
   let weightedSimilaritySum = 0;
 
@@ -571,8 +586,7 @@ export function calculateMatchScore(
       // Calculate similarity based on dimension scale
       let similarity: number;
 
-      if (dimension === 'emotionalValence' || dimension === 'fantasyRealism' ||
-          dimension === 'intellectualEmotional' || dimension === 'noveltyFamiliarity') {
+      if (bipolarDimensions.has(dimension)) {
         // For -5 to 5 scale, normalize distance to 0-1
         similarity = 1 - (Math.abs(userValue - animeValue) / 10);
       } else {
@@ -0,0 +1,237 @@
+/**
+ * Tests for the base API client
+ */
+
+import { BaseAPIClient } from './client';
+import { rateLimitManager } from './rate-limits';
+
+// Exposes the protected rate limit acquire for direct testing
+class TestClient extends BaseAPIClient {
+  public acquire(): Promise<void> {
+    return this.acquireRateLimit();
+  }
+}
+
+// Helper to build a JSON fetch response
+function jsonResponse(body: any, status: number = 200, headers: Record<string, string> = {}): Response {
+  return new Response(JSON.stringify(body), {
+    status,
+    headers: { 'content-type': 'application/json', ...headers }
+  });
+}
+
+// Let every pending promise callback run
+function flushPromises(): Promise<void> {
+  return new Promise(resolve => setImmediate(resolve));
+}
+
+const originalFetch = global.fetch;
+
+afterEach(() => {
+  global.fetch = originalFetch;
+  jest.restoreAllMocks();
+});
+
+describe('BaseAPIClient rate limiting', () => {
+  test('concurrent acquirers never take more slots than the limit allows', async () => {
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    const client = new TestClient('https://example.test', { providerName: 'acquire-race-test' });
+    const limit = rateLimitManager.getLimiter('acquire-race-test').getConfig().requestsPerWindow;
+
+    let acquired = 0;
+    const pending = Array.from({ length: limit + 5 }, () =>
+      client.acquire().then(() => { acquired++; })
+    );
+
+    await flushPromises();
+    expect(acquired).toBe(limit);
+
+    // The rest get through once the window moves on
+    await Promise.all(pending);
+    expect(acquired).toBe(limit + 5);
+  });
+
+  test('concurrent requests send no more than the limit allows', async () => {
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    const fetchMock = jest.fn(async () => jsonResponse({ ok: true }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+
+    const client = new BaseAPIClient('https://example.test', { providerName: 'request-race-test' });
+    const limit = rateLimitManager.getLimiter('request-race-test').getConfig().requestsPerWindow;
+
+    const pending = Array.from({ length: limit + 3 }, (_, i) =>
+      client.request({ method: 'GET', endpoint: `items/${i}` })
+    );
+
+    await flushPromises();
+    expect(fetchMock).toHaveBeenCalledTimes(limit);
+
+    await Promise.all(pending);
+    expect(fetchMock).toHaveBeenCalledTimes(limit + 3);
+  });
+});
+
+describe('BaseAPIClient Retry-After handling', () => {
+  // Single attempt, no limiter or cache, so each test sees exactly one response
+  function createClient(options: { maxRetries?: number; retryMaxDelay?: number } = {}): BaseAPIClient {
+    return new BaseAPIClient('https://example.test', {
+      enableCache: false,
+      enableRateLimit: false,
+      maxRetries: 0,
+      ...options
+    });
+  }
+
+  // Make one request that fails with the given status and Retry-After header
+  async function getRetryAfter(status: number, retryAfter: string): Promise<number | undefined> {
+    global.fetch = jest.fn(async () => jsonResponse({ error: 'busy' }, status, { 'retry-after': retryAfter })) as unknown as typeof fetch;
+
+    try {
+      await createClient().request({ method: 'GET', endpoint: 'items' });
+    } catch (err: any) {
+      return err.retryAfter;
+    }
+    throw new Error('Expected the request to fail');
+  }
+
+  test('parses a delay in seconds', async () => {
+    expect(await getRetryAfter(429, '120')).toBe(120);
+    expect(await getRetryAfter(503, '7')).toBe(7);
+  });
+
+  test('parses an HTTP date', async () => {
+    const retryAt = new Date(Date.now() + 30000).toUTCString();
+    const retryAfter = await getRetryAfter(429, retryAt);
+
+    // HTTP dates only have second precision
+    expect(retryAfter).toBeGreaterThanOrEqual(29);
+    expect(retryAfter).toBeLessThanOrEqual(30);
+  });
+
+  test('ignores invalid and past values', async () => {
+    expect(await getRetryAfter(429, 'soon')).toBeUndefined();
+    expect(await getRetryAfter(429, new Date(Date.now() - 60000).toUTCString())).toBeUndefined();
+    expect(await getRetryAfter(429, '0')).toBeUndefined();
+  });
+
+  test('ignores Retry-After on statuses other than 429 and 503', async () => {
+    expect(await getRetryAfter(500, '120')).toBeUndefined();
+    expect(await getRetryAfter(400, '120')).toBeUndefined();
+  });
+
+  test('caps the retry delay at retryMaxDelay', async () => {
+    const fetchMock = jest.fn()
+      .mockImplementationOnce(async () => jsonResponse({ error: 'busy' }, 503, { 'retry-after': '120' }))
+      .mockImplementationOnce(async () => jsonResponse({ ok: true }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+
+    const start = Date.now();
+    const response = await createClient({ maxRetries: 1, retryMaxDelay: 0.05 }).request({ method: 'GET', endpoint: 'items' });
+
+    expect(response.statusCode).toBe(200);
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+    expect(Date.now() - start).toBeLessThan(5000);
+  });
+});
+
+describe('BaseAPIClient in-flight request sharing', () => {
+  test('concurrent identical GETs share one fetch', async () => {
+    const fetchMock = jest.fn(async () => jsonResponse({ id: 1 }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+    const client = new BaseAPIClient('https://example.test', { enableRateLimit: false });
+
+    const [first, second] = await Promise.all([
+      client.request({ method: 'GET', endpoint: 'items', params: { page: 1 } }),
+      client.request({ method: 'GET', endpoint: 'items', params: { page: 1 } })
+    ]);
+
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    expect(first.data).toEqual({ id: 1 });
+    expect(second.data).toEqual({ id: 1 });
+  });
+
+  test('a failed request is not shared with later callers', async () => {
+    const fetchMock = jest.fn()
+      .mockImplementationOnce(async () => jsonResponse({ error: 'bad' }, 400))
+      .mockImplementationOnce(async () => jsonResponse({ id: 1 }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+    const client = new BaseAPIClient('https://example.test', { enableRateLimit: false, maxRetries: 0 });
+
+    const results = await Promise.allSettled([
+      client.request({ method: 'GET', endpoint: 'items' }),
+      client.request({ method: 'GET', endpoint: 'items' })
+    ]);
+    expect(results.map(result => result.status)).toEqual(['rejected', 'rejected']);
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    const retried = await client.request({ method: 'GET', endpoint: 'items' });
+    expect(retried.data).toEqual({ id: 1 });
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
+
+describe('BaseAPIClient response cache', () => {
+  // Responds with the requested path so each endpoint is told apart
+  function mockFetchByPath() {
+    const fetchMock = jest.fn(async (url: string) => jsonResponse({ path: new URL(url).pathname }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+    return fetchMock;
+  }
+
+  test('evicts the least recently used entry once full', async () => {
+    const fetchMock = mockFetchByPath();
+    const client = new BaseAPIClient('https://example.test', { enableRateLimit: false, maxCacheSize: 2 });
+    const get = (endpoint: string) => client.request({ method: 'GET', endpoint });
+
+    await get('a');
+    await get('b');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+
+    // Touch a so that b becomes the least recently used entry
+    await get('a');
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+
+    // Adding c goes past capacity and evicts b
+    await get('c');
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+
+    await get('a');
+    await get('c');
+    expect(fetchMock).toHaveBeenCalledTimes(3);
+
+    const refetched = await get('b');
+    expect(refetched.data).toEqual({ path: '/b' });
+    expect(fetchMock).toHaveBeenCalledTimes(4);
+  });
+
+  test('keeps params that encode differently on the wire in separate entries', async () => {
+    const fetchMock = jest.fn(async (url: string) => jsonResponse({ search: new URL(url).search }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+    const client = new BaseAPIClient('https://example.test', { enableRateLimit: false });
+    const get = (params: Record<string, any>) => client.request({ method: 'GET', endpoint: 'items', params });
+
+    const escaped = await get({ query: 'x&year=2020' });
+    const separate = await get({ query: 'x', year: 2020 });
+    expect(escaped.data).not.toEqual(separate.data);
+
+    const list = await get({ ids: [1, 2] });
+    const listString = await get({ ids: '[1,2]' });
+    expect(list.data).not.toEqual(listString.data);
+
+    expect(fetchMock).toHaveBeenCalledTimes(4);
+  });
+
+  test('refetches once an entry expires', async () => {
+    const fetchMock = mockFetchByPath();
+    const client = new BaseAPIClient('https://example.test', { enableRateLimit: false, cacheTTL: 0.05 });
+    const get = () => client.request({ method: 'GET', endpoint: 'a' });
+
+    await get();
+    await get();
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+
+    await new Promise(resolve => setTimeout(resolve, 100));
+    await get();
+    expect(fetchMock).toHaveBeenCalledTimes(2);
+  });
+});
@@ -10,6 +10,7 @@
  */
 
 import { rateLimitManager } from './rate-limits';
+import { LRUCache } from './lru-cache';
 
 // Response model
 export interface APIResponse<T = any> {
@@ -35,22 +36,18 @@ interface CacheKey {
   params?: Record<string, any>;
 }
 
-// Cache item
-interface CacheItem<T = any> {
-  response: APIResponse<T>;
-  timestamp: number;
-}
-
 export class BaseAPIClient {
   private baseUrl: string;
   private cacheEnabled: boolean;
   private rateLimitEnabled: boolean;
-  private cache: Map<string, CacheItem>;
+  private cache: LRUCache<string, APIResponse>;
+  private inFlightRequests: Map<string, Promise<APIResponse>>;
   private maxRetries: number;
   private retryBaseDelay: number;
   private retryMaxDelay: number;
   private retryableStatusCodes: Set<number>;
   private cacheTTL: number; // Time to live in milliseconds
+  private maxCacheSize: number; // Maximum number of cached responses
   private providerName: string; // API provider name for rate limiting
 
   /**
@@ -67,6 +64,7 @@ export class BaseAPIClient {
     retryMaxDelay?: number;
     retryableStatusCodes?: number[];
     cacheTTL?: number; // In seconds
+    maxCacheSize?: number; // Maximum number of cached responses
     providerName?: string; // API provider name for rate limiting
   }) {
     this.baseUrl = baseUrl.endsWith('/') ? baseUrl.slice(0, -1) : baseUrl;
@@ -77,7 +75,9 @@ export class BaseAPIClient {
     this.retryMaxDelay = options?.retryMaxDelay ?? 60.0;
     this.retryableStatusCodes = new Set(options?.retryableStatusCodes ?? [408, 429, 500, 502, 503, 504]);
     this.cacheTTL = (options?.cacheTTL ?? 300) * 1000; // Convert to milliseconds
-    this.cache = new Map();
+    this.maxCacheSize = options?.maxCacheSize ?? 1000;
+    this.cache = new LRUCache({ maxSize: this.maxCacheSize, ttlMs: this.cacheTTL });
+    this.inFlightRequests = new Map();
 
     // Determine provider name from base URL if not explicitly provided
     this.providerName = options?.providerName || this.detectProviderFromUrl(baseUrl);
@@ -125,6 +125,27 @@ export class BaseAPIClient {
     return Math.random() * maxDelay * 1000; // Convert to milliseconds
   }
 
+  /**
+   * Parse a Retry-After header value.
+   *
+   * @param value Header value, either delay-seconds or an HTTP-date
+   * @returns Delay in seconds, or undefined if the value can't be parsed
+   */
+  private parseRetryAfter(value: string): number | undefined {
+    const seconds = parseInt(value, 10);
+    if (!isNaN(seconds)) {
+      return seconds > 0 ? seconds : undefined;
+    }
+
+    const date = Date.parse(value);
+    if (!isNaN(date)) {
+      const delaySeconds = Math.ceil((date - Date.now()) / 1000);
+      return delaySeconds > 0 ? delaySeconds : undefined;
+    }
+
+    return undefined;
+  }
+
   /**
    * Generate a cache key from a URL and params.
    *
@@ -134,65 +155,59 @@ export class BaseAPIClient {
   private generateCacheKey(cacheKey: CacheKey): string {
     const { url, params } = cacheKey;
 
-    if (!params || Object.keys(params).length === 0) {
+    if (!params) {
       return url;
     }
 
-    // Sort params by key to ensure consistent cache keys
-    const sortedParams = Object.keys(params)
-      .sort()
-      .map(key => `${key}=${JSON.stringify(params[key])}`)
-      .join('&');
+    // Sort params by key to ensure consistent cache keys. Values are
+    // stringified the same way executeRequest puts them on the query string,
+    // and names and values are encoded so that a value containing '&' or '='
+    // can't produce the same key as a different set of params
+    let key = url;
+    let separator = '?';
+    for (const name of Object.keys(params).sort()) {
+      const value = params[name];
+      if (value === undefined || value === null) {
+        continue;
+      }
+
+      key += `${separator}${encodeURIComponent(name)}=${encodeURIComponent(String(value))}`;
+      separator = '&';
+    }
 
-    return `${url}?${sortedParams}`;
+    return key;
   }
 
   /**
    * Get a cached response if available and not expired.
    *
-   * @param url The request URL
-   * @param params The request parameters
+   * @param cacheKey Cache key from generateCacheKey
    * @returns Cached response or undefined if not in cache or expired
    */
-  private getCachedResponse<T>(url: string, params?: Record<string, any>): APIResponse<T> | undefined {
+  private getCachedResponse<T>(cacheKey: string): APIResponse<T> | undefined {
     if (!this.cacheEnabled) return undefined;
 
-    const cacheKey = this.generateCacheKey({ url, params });
-    const cachedItem = this.cache.get(cacheKey);
-
-    if (!cachedItem) return undefined;
-
-    // Check if cache is expired
-    const now = Date.now();
-    if (now - cachedItem.timestamp > this.cacheTTL) {
-      this.cache.delete(cacheKey);
-      return undefined;
-    }
-
-    return cachedItem.response as APIResponse<T>;
+    // Expired entries are dropped and hits become the most recently used
+    return this.cache.get(cacheKey) as APIResponse<T> | undefined;
   }
 
   /**
    * Store a response in the cache.
    *
-   * @param url The request URL
-   * @param params The request parameters
+   * @param cacheKey Cache key from generateCacheKey
    * @param response The response to cache
    */
-  private cacheResponse<T>(url: string, params: Record<string, any> | undefined, response: APIResponse<T>): void {
+  private cacheResponse<T>(cacheKey: string, response: APIResponse<T>): void {
     if (!this.cacheEnabled) return;
 
-    const cacheKey = this.generateCacheKey({ url, params });
-    this.cache.set(cacheKey, {
-      response,
-      timestamp: Date.now()
-    });
+    // Evicts the least recently used responses once maxCacheSize is reached
+    this.cache.set(cacheKey, response);
   }
 
   /**
    * Execute a single HTTP request without retries.
    *
-   * @param method HTTP method
+   * @param method HTTP method, already uppercased
    * @param url Request URL
    * @param params Query parameters
    * @param data Request body data
@@ -225,7 +240,7 @@ export class BaseAPIClient {
 
     // Build request options
     const requestOptions: RequestInit = {
-      method: method.toUpperCase(),
+      method,
       headers: {
         'Content-Type': 'application/json',
         'Accept': 'application/json',
@@ -245,15 +260,15 @@ export class BaseAPIClient {
     // Make the request
     const response = await fetch(finalUrl, requestOptions);
 
-    // Extract headers into a plain object
+    // Extract headers into a plain object (fetch already lowercases header names)
     const responseHeaders: Record<string, string> = {};
     response.headers.forEach((value, key) => {
-      responseHeaders[key.toLowerCase()] = value;
+      responseHeaders[key] = value;
     });
 
     // Parse response
     let responseData;
-    const contentType = response.headers.get('Content-Type') || '';
+    const contentType = responseHeaders['content-type'] || '';
     if (contentType.includes('application/json')) {
       responseData = await response.json();
     } else {
@@ -285,10 +300,9 @@ export class BaseAPIClient {
 
       error.statusCode = response.status;
 
-      // Add retry-after if available
-      if (response.status === 429 && responseHeaders['retry-after']) {
-        const retryAfter = parseInt(responseHeaders['retry-after'], 10) || undefined;
-        error.retryAfter = retryAfter;
+      // Add retry-after if available (sent with 429 and 503 responses)
+      if ((response.status === 429 || response.status === 503) && responseHeaders['retry-after']) {
+        error.retryAfter = this.parseRetryAfter(responseHeaders['retry-after']);
       }
 
       throw error;
@@ -319,52 +333,113 @@ export class BaseAPIClient {
       useCache = true
     } = options;
 
+    const requestMethod = method.toUpperCase();
     const url = `${this.baseUrl}/${endpoint.replace(/^\/+/, '')}`;
 
+    // Only GET responses are cached. The key is built once here and reused
+    // for both the lookup and the store after a successful request
+    const cacheKey = useCache && this.cacheEnabled && requestMethod === 'GET'
+      ? this.generateCacheKey({ url, params })
+      : undefined;
+
     // Check cache for GET requests
-    if (useCache && method.toUpperCase() === 'GET') {
-      const cachedResponse = this.getCachedResponse<T>(url, params);
+    if (cacheKey !== undefined) {
+      const cachedResponse = this.getCachedResponse<T>(cacheKey);
       if (cachedResponse) {
         return cachedResponse;
       }
     }
 
-    // Rate limiting check
-    if (this.rateLimitEnabled) {
-      // Check if we're allowed to make this request
-      if (!rateLimitManager.checkLimit(this.providerName)) {
-        // Calculate delay before we can try again
-        const waitTime = rateLimitManager.getTimeUntilNextRequest(this.providerName);
-
-        if (waitTime <= 0) {
-          // Something is wrong with the rate limiter, proceed with caution
-          console.warn(`Rate limiter reported limit exceeded but gave invalid wait time for ${this.providerName}`);
-        } else if (waitTime < 10000) {
-          // If wait time is reasonable, actually wait
-          console.log(`Rate limit reached for ${this.providerName}, waiting ${waitTime}ms before retrying`);
-          await new Promise(resolve => setTimeout(resolve, waitTime));
-        } else {
-          // If wait time is too long, throw rate limit error
-          const errorMsg = `Rate limit exceeded for ${this.providerName}. Try again in ${Math.ceil(waitTime / 1000)} seconds.`;
-          const error = new Error(errorMsg) as Error & { statusCode: number };
-          error.statusCode = 429;
-          throw error;
-        }
+    if (cacheKey === undefined) {
+      return this.sendRequest<T>(requestMethod, url, params, data, headers);
+    }
+
+    // Identical GETs that are already on the wire share that request instead
+    // of spending another rate limit slot and round trip on the same response
+    const inFlight = this.inFlightRequests.get(cacheKey);
+    if (inFlight) {
+      return inFlight as Promise<APIResponse<T>>;
+    }
+
+    const pending = this.sendRequest<T>(requestMethod, url, params, data, headers, cacheKey)
+      .finally(() => {
+        this.inFlightRequests.delete(cacheKey);
+      });
+    this.inFlightRequests.set(cacheKey, pending);
+    return pending;
+  }
+
+  /**
+   * Wait for a rate limit slot and record the request against it. Checking
+   * and recording happen in one synchronous step, so concurrent callers can't
+   * all pass the check before any of them is counted. Also used for provider
+   * calls that don't go through request(), so they share the provider's limit
+   * with everything else.
+   *
+   * @throws Error with statusCode 429 if the wait would be unreasonably long
+   */
+  protected async acquireRateLimit(): Promise<void> {
+    if (!this.rateLimitEnabled) {
+      return;
+    }
+
+    // Try again after each wait, since other requests may have taken the
+    // freed slot while this one was sleeping
+    while (!rateLimitManager.recordRequest(this.providerName)) {
+      // Calculate delay before we can try again
+      const waitTime = rateLimitManager.getTimeUntilNextRequest(this.providerName);
+
+      if (waitTime <= 0) {
+        // Something is wrong with the rate limiter, proceed with caution
+        console.warn(`Rate limiter reported limit exceeded but gave invalid wait time for ${this.providerName}`);
+        break;
+      } else if (waitTime < 10000) {
+        // If wait time is reasonable, actually wait
+        console.log(`Rate limit reached for ${this.providerName}, waiting ${waitTime}ms before retrying`);
+        await new Promise(resolve => setTimeout(resolve, waitTime));
+      } else {
+        // If wait time is too long, throw rate limit error
+        const errorMsg = `Rate limit exceeded for ${this.providerName}. Try again in ${Math.ceil(waitTime / 1000)} seconds.`;
+        const error = new Error(errorMsg) as Error & { statusCode: number };
+        error.statusCode = 429;
+        throw error;
       }
     }
+  }
 
+  /**
+   * Send a request with rate limiting, retries, and backoff, caching the
+   * response when a cache key is given.
+   *
+   * @param method HTTP method, already uppercased
+   * @param url Request URL
+   * @param params Query parameters
+   * @param data Request body data
+   * @param headers Custom request headers
+   * @param cacheKey Cache key to store a successful response under
+   * @returns Promise resolving to the API response
+   * @throws Error if all retry attempts fail or rate limited
+   */
+  private async sendRequest<T>(
+    method: string,
+    url: string,
+    params?: Record<string, any>,
+    data?: Record<string, any> | string,
+    headers?: Record<string, string>,
+    cacheKey?: string
+  ): Promise<APIResponse<T>> {
     // Initialize retry tracking
     let attempt = 0;
     let lastError: Error & { statusCode?: number; retryAfter?: number } | null = null;
 
     // Retry loop with exponential backoff
     while (attempt <= this.maxRetries) {
-      try {
-        // Record this request attempt for rate limiting
-        if (this.rateLimitEnabled) {
-          rateLimitManager.recordRequest(this.providerName);
-        }
+      // Take a rate limit slot for this attempt, waiting if none is free. This
+      // stays outside the try so our own limit error isn't treated as a 429
+      // from the server
+      await this.acquireRateLimit();
 
+      try {
         // Execute the request
         const result = await this.executeRequest(method, url, params, data, headers);
 
@@ -376,8 +451,8 @@ export class BaseAPIClient {
         };
 
         // Cache successful GET responses
-        if (useCache && method.toUpperCase() === 'GET') {
-          this.cacheResponse<T>(url, params, apiResponse);
+        if (cacheKey !== undefined) {
+          this.cacheResponse<T>(cacheKey, apiResponse);
         }
 
         return apiResponse;
@@ -411,8 +486,8 @@ export class BaseAPIClient {
         // Check if status code is retryable
         else if (err.statusCode && this.retryableStatusCodes.has(err.statusCode)) {
           shouldRetry = true;
-          // Get retry-after header if available
-          if (err.statusCode === 429 && err.retryAfter) {
+          // Honor the server's retry-after hint when it sent one
+          if (err.retryAfter) {
             retryAfter = err.retryAfter;
           }
         }
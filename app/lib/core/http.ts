@@ -0,0 +1,20 @@
+/**
+ * Shared HTTP client for provider integrations
+ *
+ * The AniList, MAL and YouTube clients call their APIs through axios. Sharing
+ * one axios instance with keep-alive agents lets every client instance reuse
+ * pooled connections to the same host instead of opening a new socket and TLS
+ * session for each request.
+ */
+
+import axios from 'axios';
+import http from 'http';
+import https from 'https';
+
+// Upper bound on concurrent sockets per host across all provider clients
+const MAX_SOCKETS_PER_HOST = 50;
+
+export const httpClient = axios.create({
+  httpAgent: new http.Agent({ keepAlive: true, maxSockets: MAX_SOCKETS_PER_HOST }),
+  httpsAgent: new https.Agent({ keepAlive: true, maxSockets: MAX_SOCKETS_PER_HOST })
+});
@@ -0,0 +1,103 @@
+/**
+ * Tests for the LRU cache
+ */
+
+import { LRUCache } from './lru-cache';
+
+afterEach(() => {
+  jest.restoreAllMocks();
+});
+
+describe('LRUCache', () => {
+  test('evicts the least recently used entry once full', () => {
+    const cache = new LRUCache<string, number>({ maxSize: 2 });
+
+    cache.set('a', 1);
+    cache.set('b', 2);
+
+    // Reading a makes b the least recently used entry
+    expect(cache.get('a')).toBe(1);
+    cache.set('c', 3);
+
+    expect(cache.has('b')).toBe(false);
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('c')).toBe(3);
+    expect(cache.size).toBe(2);
+  });
+
+  test('setting an existing key refreshes it without growing the cache', () => {
+    const cache = new LRUCache<string, number>({ maxSize: 2 });
+
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.set('a', 10);
+    cache.set('c', 3);
+
+    expect(Array.from(cache.keys())).toEqual(['a', 'c']);
+    expect(cache.get('a')).toBe(10);
+  });
+
+  test('has() does not change recency', () => {
+    const cache = new LRUCache<string, number>({ maxSize: 2 });
+
+    cache.set('a', 1);
+    cache.set('b', 2);
+    expect(cache.has('a')).toBe(true);
+    cache.set('c', 3);
+
+    expect(cache.has('a')).toBe(false);
+    expect(cache.has('b')).toBe(true);
+  });
+
+  test('reports evicted entries to onEvict', () => {
+    const evicted: Array<[string, number]> = [];
+    const cache = new LRUCache<string, number>({
+      maxSize: 1,
+      onEvict: (key, value) => evicted.push([key, value])
+    });
+
+    cache.set('a', 1);
+    cache.set('b', 2);
+    cache.delete('b');
+
+    // Explicit deletes aren't evictions
+    expect(evicted).toEqual([['a', 1]]);
+  });
+
+  test('bounds initial entries, keeping the newest', () => {
+    const cache = new LRUCache<string, number>({ maxSize: 2 }, [['a', 1], ['b', 2], ['c', 3]]);
+
+    expect(Array.from(cache.entries())).toEqual([['b', 2], ['c', 3]]);
+  });
+
+  test('treats entries past their TTL as missing and removes them', () => {
+    let now = 1000;
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+    const cache = new LRUCache<string, string | null>({ maxSize: 10, ttlMs: 500 });
+
+    cache.set('hit', 'value');
+    cache.set('miss', null);
+
+    now = 1500;
+    expect(cache.get('hit')).toBe('value');
+    expect(cache.has('miss')).toBe(true);
+
+    now = 1501;
+    expect(cache.get('hit')).toBeUndefined();
+    expect(cache.has('miss')).toBe(false);
+    expect(cache.size).toBe(0);
+  });
+
+  test('setting an entry again restarts its TTL', () => {
+    let now = 0;
+    jest.spyOn(Date, 'now').mockImplementation(() => now);
+    const cache = new LRUCache<string, number>({ maxSize: 10, ttlMs: 100 });
+
+    cache.set('a', 1);
+    now = 80;
+    cache.set('a', 2);
+    now = 150;
+
+    expect(cache.get('a')).toBe(2);
+  });
+});
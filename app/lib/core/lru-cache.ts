@@ -0,0 +1,126 @@
+/**
+ * Least recently used cache
+ *
+ * A Map that keeps at most maxSize entries. get() marks an entry as recently
+ * used and set() evicts the least recently used entries once the cache is
+ * full. Map preserves insertion order, so re-inserting on access keeps the
+ * least recently used entries first in line for eviction.
+ *
+ * With a ttlMs, entries expire that long after they were last set; expired
+ * entries are removed when they're next looked up and treated as missing.
+ */
+
+export interface LRUCacheOptions<K, V> {
+  // Maximum number of entries to keep
+  maxSize: number;
+
+  // Optional time to live in milliseconds
+  ttlMs?: number;
+
+  // Optional callback for entries evicted to make room
+  onEvict?: (key: K, value: V) => void;
+}
+
+export class LRUCache<K, V> extends Map<K, V> {
+  private readonly maxSize: number;
+  private readonly ttlMs?: number;
+  private readonly onEvict?: (key: K, value: V) => void;
+  private readonly expiresAt: Map<K, number> = new Map();
+
+  /**
+   * Create a cache, optionally seeded with entries
+   *
+   * @param options Size limit, TTL, and eviction callback
+   * @param entries Initial entries, oldest first
+   */
+  constructor(options: LRUCacheOptions<K, V>, entries?: Iterable<readonly [K, V]> | null) {
+    // Seed after the fields are set up, since Map's constructor would call set()
+    super();
+    this.maxSize = options.maxSize;
+    this.ttlMs = options.ttlMs;
+    this.onEvict = options.onEvict;
+
+    if (entries) {
+      for (const [key, value] of entries) {
+        this.set(key, value);
+      }
+    }
+  }
+
+  /**
+   * Check whether an entry has expired, removing it if so
+   *
+   * @param key Entry key
+   * @returns True if the entry was expired and removed
+   */
+  private removeIfExpired(key: K): boolean {
+    const expiresAt = this.expiresAt.get(key);
+    if (expiresAt !== undefined && Date.now() > expiresAt) {
+      this.delete(key);
+      return true;
+    }
+    return false;
+  }
+
+  /**
+   * Get an entry and mark it as most recently used
+   *
+   * @param key Entry key
+   * @returns The value, or undefined if missing or expired
+   */
+  public get(key: K): V | undefined {
+    if (!super.has(key) || this.removeIfExpired(key)) {
+      return undefined;
+    }
+
+    const value = super.get(key) as V;
+    super.delete(key);
+    super.set(key, value);
+    return value;
+  }
+
+  /**
+   * Check for an unexpired entry without changing its recency
+   *
+   * @param key Entry key
+   * @returns True if the entry exists and hasn't expired
+   */
+  public has(key: K): boolean {
+    return super.has(key) && !this.removeIfExpired(key);
+  }
+
+  /**
+   * Store an entry as most recently used, evicting the least recently used
+   * entries if the cache is over its size limit
+   *
+   * @param key Entry key
+   * @param value Entry value
+   * @returns This cache
+   */
+  public set(key: K, value: V): this {
+    super.delete(key);
+    super.set(key, value);
+    if (this.ttlMs !== undefined) {
+      this.expiresAt.set(key, Date.now() + this.ttlMs);
+    }
+
+    while (this.size > this.maxSize) {
+      const oldestKey = super.keys().next().value as K;
+      const oldestValue = super.get(oldestKey) as V;
+      this.delete(oldestKey);
+      this.onEvict?.(oldestKey, oldestValue);
+    }
+
+    return this;
+  }
+
+  public delete(key: K): boolean {
+    this.expiresAt.delete(key);
+    return super.delete(key);
+  }
+
+  public clear(): void {
+    this.expiresAt.clear();
+    super.clear();
+  }
+}
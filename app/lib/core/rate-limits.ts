@@ -68,6 +68,15 @@ export const API_RATE_LIMITS: Record<string, RateLimitConfig> = {
   }
 };
 
+/**
+ * Current time in milliseconds from a monotonic clock. Unlike Date.now(),
+ * this never jumps when the system clock is adjusted, so window arithmetic
+ * can't drift or get stuck.
+ */
+function monotonicNow(): number {
+  return performance.now();
+}
+
 /**
  * Rate limiter class that tracks requests and enforces limits
  */
@@ -109,7 +118,7 @@ export class RateLimiter {
    * @returns True if request is allowed, false if rate limited
    */
   public checkLimit(dryRun = false): boolean {
-    const now = Date.now();
+    const now = monotonicNow();
 
     // If we've been completely blocked temporarily, check if we can reset
     if (this.nextAllowedRequestTime > 0) {
@@ -123,32 +132,54 @@ export class RateLimiter {
     }
 
     // Remove timestamps outside the current window
-    const windowStart = now - this.config.windowMs;
-    const validTimestamps = this.requestTimestamps.filter(ts => ts >= windowStart);
+    this.pruneExpired(now);
 
     // Check if we've hit the limit
-    if (validTimestamps.length >= this.config.requestsPerWindow) {
+    if (this.requestTimestamps.length >= this.config.requestsPerWindow) {
       return false;
     }
 
     // Update state if not a dry run
     if (!dryRun) {
-      this.requestTimestamps = validTimestamps;
       this.requestTimestamps.push(now);
     }
 
     return true;
   }
 
+  /**
+   * Drop timestamps that have left the current window. Timestamps are pushed
+   * in order from a monotonic clock, so the expired ones are always a prefix
+   * and can be removed in place. Expired entries never count towards the
+   * limit, so this is safe to do during a dry run.
+   *
+   * @param now Current monotonic time in milliseconds
+   */
+  private pruneExpired(now: number): void {
+    const windowStart = now - this.config.windowMs;
+    let expired = 0;
+    while (expired < this.requestTimestamps.length && this.requestTimestamps[expired] < windowStart) {
+      expired++;
+    }
+    if (expired > 0) {
+      this.requestTimestamps.splice(0, expired);
+    }
+  }
+
   /**
    * Record a request and check if rate limited
    *
    * @returns True if request is allowed, false if rate limited
    */
   public recordRequest(): boolean {
-    // Reset consecutive errors counter on successful requests
-    this.consecutiveRateLimitErrors = 0;
-    return this.checkLimit(false);
+    const allowed = this.checkLimit(false);
+
+    // Reset consecutive errors counter once a request actually goes out
+    if (allowed) {
+      this.consecutiveRateLimitErrors = 0;
+    }
+
+    return allowed;
   }
 
   /**
@@ -158,7 +189,7 @@ export class RateLimiter {
    */
   public handleRateLimitResponse(retryAfterSeconds?: number): void {
     // Clear current window and set a retry time
-    const now = Date.now();
+    const now = monotonicNow();
     this.requestTimestamps = [];
 
     // Increment consecutive rate limit errors
@@ -191,22 +222,27 @@ export class RateLimiter {
    * @returns Milliseconds until next request is allowed, 0 if requests are allowed now
    */
   public getTimeUntilNextRequest(): number {
-    const now = Date.now();
+    const now = monotonicNow();
 
     // If explicitly blocked, return time until unblocked
     if (this.nextAllowedRequestTime > now) {
       return this.nextAllowedRequestTime - now;
     }
 
+    // Only requests still inside the window count towards the limit
+    this.pruneExpired(now);
+    const validTimestamps = this.requestTimestamps;
+
     // If under the limit, return 0
-    if (this.requestTimestamps.length < this.config.requestsPerWindow) {
+    if (validTimestamps.length < this.config.requestsPerWindow) {
       return 0;
     }
 
-    // Calculate when the oldest request in the window will expire
-    const oldestTimestamp = this.requestTimestamps[0];
-    const timeUntilWindowAdvances = (oldestTimestamp + this.config.windowMs) - now;
-    return Math.max(0, timeUntilWindowAdvances);
+    // Calculate when enough requests will have left the window for one more
+    const blockingTimestamp = validTimestamps[validTimestamps.length - this.config.requestsPerWindow];
+    const timeUntilWindowAdvances = (blockingTimestamp + this.config.windowMs) - now;
+    // Still limited at this instant, so report at least 1ms rather than 0
+    return Math.max(1, timeUntilWindowAdvances + 1);
   }
 
   /**
@@ -2,6 +2,7 @@ import { Redis } from '@upstash/redis';
 import { Pool } from '@neondatabase/serverless';
 import { Question, QuestionOption } from './types';
 import { v4 as uuidv4 } from 'uuid';
+import { LRUCache } from './core/lru-cache';
 
 // Determine if we should use the real database or in-memory implementation
 const isLocalDev = process.env.NODE_ENV === 'development' || process.env.USE_IN_MEMORY_DB === 'true';
@@ -82,11 +83,17 @@ export function dumpStorage(): string {
   return JSON.stringify(LocalStorage.getStorage());
 }
 
+// Upper bound on profiles/sessions kept by the in-memory store, so a
+// long-running dev server doesn't grow without limit. Recency is only tracked
+// in memory: reads don't write the new order back to global storage, so after
+// a reload from storage the order is whatever it was at the last save
+const MAX_IN_MEMORY_ENTRIES = 10000;
+
 // In-memory implementation for local development
 export class InMemoryDatabase implements Database {
   // Add public sessions and profiles maps for direct access
-  public sessions: Map<string, Session> = new Map();
-  public profiles: Map<string, Profile> = new Map();
+  public sessions: Map<string, Session> = this._createSessionsMap();
+  public profiles: Map<string, Profile> = this._createProfilesMap();
   // These methods are now public to allow direct access for debugging and session creation
   getProfiles(): string | null {
     return LocalStorage.getItem('profiles');
@@ -118,6 +125,19 @@ export class InMemoryDatabase implements Database {
     }
   }
   
+  // Bounded maps that evict the least recently used entries
+  _createSessionsMap(entries?: Iterable<readonly [string, Session]>): Map<string, Session> {
+    return new LRUCache<string, Session>({ maxSize: MAX_IN_MEMORY_ENTRIES }, entries);
+  }
+  
+  _createProfilesMap(entries?: Iterable<readonly [string, Profile]>): Map<string, Profile> {
+    return new LRUCache<string, Profile>({
+      maxSize: MAX_IN_MEMORY_ENTRIES,
+      // Sessions point at profiles, so when a profile is evicted its sessions go too
+      onEvict: evictedId => this._removeSessionsForProfile(evictedId)
+    }, entries);
+  }
+  
   // Private helper methods for internal use
   _getProfilesMap(): Map<string, Profile> {
     // First, try to load from local storage into our class instance map
@@ -126,7 +146,7 @@ export class InMemoryDatabase implements Database {
       if (storedData) {
         try {
           const parsed = JSON.parse(storedData);
-          this.profiles = new Map(parsed);
+          this.profiles = this._createProfilesMap(parsed);
         } catch (error) {
           console.error('Error parsing profiles from storage:', error);
         }
@@ -142,7 +162,7 @@ export class InMemoryDatabase implements Database {
       if (storedData) {
         try {
           const parsed = JSON.parse(storedData);
-          this.sessions = new Map(parsed);
+          this.sessions = this._createSessionsMap(parsed);
         } catch (error) {
           console.error('Error parsing sessions from storage:', error);
         }
@@ -151,6 +171,23 @@ export class InMemoryDatabase implements Database {
     return this.sessions;
   }
 
+  // Remove every session pointing at a profile
+  _removeSessionsForProfile(profileId: string): void {
+    const sessions = this._getSessionsMap();
+    let removed = false;
+    
+    for (const [sessionId, session] of sessions) {
+      if (session.profileId === profileId) {
+        sessions.delete(sessionId);
+        removed = true;
+      }
+    }
+    
+    if (removed) {
+      this.saveSessions(sessions);
+    }
+  }
+
   async createProfile(profile: Omit<Profile, 'id'>): Promise<Profile> {
     const id = uuidv4();
     const newProfile = { ...profile, id, createdAt: new Date(), updatedAt: new Date() };
@@ -163,6 +200,7 @@ export class InMemoryDatabase implements Database {
 
   async getProfile(id: string): Promise<Profile | null> {
     const profiles = this._getProfilesMap();
+    // Reading marks the profile as recently used
     return profiles.get(id) || null;
   }
 
@@ -198,9 +236,11 @@ export class InMemoryDatabase implements Database {
 
   async getSession(id: string): Promise<Session | null> {
     const sessions = this._getSessionsMap();
+    // Reading marks the session as recently used
     const session = sessions.get(id);
     console.log(`getSession(${id}): ${session ? 'found' : 'not found'}`);
-    return session || null;
+    if (!session) return null;
+    return session;
   }
 
   async updateSession(session: Session): Promise<Session> {
@@ -1,5 +1,5 @@
 import { BaseAPIClient, APIResponse } from '../../core/client';
-import axios from 'axios';
+import { httpClient } from '../../core/http';
 
 // AniList Models
 export interface AnimeTitle {
@@ -87,6 +87,291 @@ export interface UserInfo {
   };
 }
 
+/**
+ * Collapse the indentation and newlines in a GraphQL document. Whitespace is
+ * insignificant in GraphQL, so this only shrinks the request body.
+ */
+function compactQuery(query: string): string {
+  return query.replace(/\s+/g, ' ').trim();
+}
+
+// GraphQL documents are built and compacted once at module load and shared
+// by every request
+const SEARCH_ANIME_QUERY = compactQuery(`
+  query ($search: String, $limit: Int) {
+    Page(page: 1, perPage: $limit) {
+      media(search: $search, type: ANIME) {
+        id
+        title {
+          romaji
+          english
+          native
+        }
+        coverImage {
+          medium
+          large
+          extraLarge
+          color
+        }
+        description
+        averageScore
+        popularity
+        genres
+      }
+    }
+  }
+`);
+
+const ANIME_DETAILS_QUERY = compactQuery(`
+  query ($id: Int) {
+    Media(id: $id, type: ANIME) {
+      id
+      title {
+        romaji
+        english
+        native
+      }
+      description
+      genres
+      coverImage {
+        medium
+        large
+        extraLarge
+        color
+      }
+      averageScore
+      popularity
+      episodes
+      format
+      status
+      seasonYear
+      season
+      studios {
+        nodes {
+          name
+        }
+      }
+      source
+      trailer {
+        id
+        site
+      }
+      idMal
+    }
+  }
+`);
+
+const USER_ANIME_LIST_QUERY = compactQuery(`
+  query ($username: String, $status: MediaListStatus, $limit: Int) {
+    MediaListCollection(userName: $username, type: ANIME, status: $status) {
+      lists {
+        entries {
+          media {
+            id
+            title {
+              romaji
+              english
+            }
+            coverImage {
+              medium
+              large
+              extraLarge
+              color
+            }
+            genres
+            averageScore
+            popularity
+          }
+          status
+          score
+          progress
+          repeat
+          updatedAt
+        }
+      }
+    }
+  }
+`);
+
+const UPDATE_ANIME_STATUS_MUTATION = compactQuery(`
+  mutation ($mediaId: Int, $status: MediaListStatus, $score: Float, $progress: Int) {
+    SaveMediaListEntry(mediaId: $mediaId, status: $status, score: $score, progress: $progress) {
+      id
+      status
+      score
+      progress
+    }
+  }
+`);
+
+const USER_INFO_QUERY = compactQuery(`
+  query ($name: String) {
+    User(name: $name) {
+      id
+      name
+      avatar {
+        large
+        medium
+      }
+      bannerImage
+      about
+      createdAt
+      statistics {
+        anime {
+          count
+          meanScore
+          minutesWatched
+          episodesWatched
+        }
+      }
+    }
+  }
+`);
+
+const SEASON_ANIME_QUERY = compactQuery(`
+  query ($season: MediaSeason, $year: Int, $sort: [MediaSort], $limit: Int) {
+    Page(page: 1, perPage: $limit) {
+      media(season: $season, seasonYear: $year, type: ANIME, sort: $sort) {
+        id
+        title {
+          romaji
+          english
+          native
+        }
+        coverImage {
+          large
+          medium
+        }
+        description
+        format
+        episodes
+        status
+        genres
+        studios {
+          nodes {
+            name
+          }
+        }
+        startDate {
+          year
+          month
+          day
+        }
+        popularity
+        averageScore
+        seasonYear
+        season
+      }
+    }
+  }
+`);
+
+const CURRENTLY_AIRING_QUERY = compactQuery(`
+  query ($status: MediaStatus, $sort: [MediaSort], $limit: Int) {
+    Page(page: 1, perPage: $limit) {
+      media(status: $status, type: ANIME, sort: $sort) {
+        id
+        title {
+          romaji
+          english
+          native
+        }
+        coverImage {
+          large
+          medium
+        }
+        description
+        format
+        episodes
+        status
+        genres
+        studios {
+          nodes {
+            name
+          }
+        }
+        startDate {
+          year
+          month
+          day
+        }
+        popularity
+        averageScore
+        seasonYear
+        season
+      }
+    }
+  }
+`);
+
+const SORTED_ANIME_PAGE_QUERY = compactQuery(`
+  query ($page: Int, $perPage: Int, $sort: [MediaSort]) {
+    Page(page: $page, perPage: $perPage) {
+      media(type: ANIME, sort: $sort) {
+        id
+        title {
+          romaji
+          english
+          native
+        }
+        coverImage {
+          large
+          medium
+          extraLarge
+          color
+        }
+        description
+        format
+        episodes
+        status
+        genres
+        studios {
+          nodes {
+            name
+          }
+        }
+        startDate {
+          year
+          month
+          day
+        }
+        popularity
+        averageScore
+        seasonYear
+        season
+        idMal
+      }
+    }
+  }
+`);
+
+const ANIME_RECOMMENDATIONS_QUERY = compactQuery(`
+  query ($id: Int) {
+    Media(id: $id, type: ANIME) {
+      recommendations(sort: RATING_DESC) {
+        nodes {
+          mediaRecommendation {
+            id
+            title {
+              romaji
+              english
+              native
+            }
+            description
+            genres
+            coverImage {
+              medium
+              large
+            }
+            averageScore
+            popularity
+          }
+        }
+      }
+    }
+  }
+`);
+
 /**
  * AniList API client
  *
@@ -94,6 +379,7 @@ export interface UserInfo {
  */
 export class AniListClient extends BaseAPIClient {
   private accessToken?: string;
+  private headers: Record<string, string>;
   private readonly endpoint = 'https://graphql.anilist.co';
 
   /**
@@ -112,14 +398,16 @@ export class AniListClient extends BaseAPIClient {
   ) {
     super('https://graphql.anilist.co', options);
     this.accessToken = accessToken;
+    this.headers = this.buildHeaders();
   }
 
   /**
-   * Get headers with authentication if available
+   * Build request headers with authentication if available. Called only when
+   * the token changes; requests reuse the stored headers.
    *
    * @returns Headers object with authentication if token is set
    */
-  private getHeaders(): Record<string, string> {
+  private buildHeaders(): Record<string, string> {
     const headers: Record<string, string> = {
       'Content-Type': 'application/json',
       'Accept': 'application/json'
@@ -150,7 +438,7 @@ export class AniListClient extends BaseAPIClient {
         query,
         variables: variables || {}
       },
-      headers: this.getHeaders()
+      headers: this.headers
     });
   }
 
@@ -169,33 +457,8 @@ export class AniListClient extends BaseAPIClient {
       throw new Error('Search query cannot be empty');
     }
 
-    const gqlQuery = `
-      query ($search: String, $limit: Int) {
-        Page(page: 1, perPage: $limit) {
-          media(search: $search, type: ANIME) {
-            id
-            title {
-              romaji
-              english
-              native
-            }
-            coverImage {
-              medium
-              large
-              extraLarge
-              color
-            }
-            description
-            averageScore
-            popularity
-            genres
-          }
-        }
-      }
-    `;
-
     const response = await this.graphqlRequest(
-      gqlQuery,
+      SEARCH_ANIME_QUERY,
       { search: query, limit: Math.min(limit, 50) }
     );
 
@@ -219,48 +482,10 @@ export class AniListClient extends BaseAPIClient {
       throw new Error('Anime ID is required');
     }
 
-    const query = `
-      query ($id: Int) {
-        Media(id: $id, type: ANIME) {
-          id
-          title {
-            romaji
-            english
-            native
-          }
-          description
-          genres
-          coverImage {
-            medium
-            large
-            extraLarge
-            color
-          }
-          averageScore
-          popularity
-          episodes
-          format
-          status
-          seasonYear
-          season
-          studios {
-            nodes {
-              name
-            }
-          }
-          source
-          trailer {
-            id
-            site
-          }
-          idMal
-        }
-      }
-    `;
-
     try {
-      const response = await axios.post(this.endpoint, {
-        query,
+      await this.acquireRateLimit();
+      const response = await httpClient.post(this.endpoint, {
+        query: ANIME_DETAILS_QUERY,
         variables: { id: animeId }
       });
 
@@ -292,40 +517,8 @@ export class AniListClient extends BaseAPIClient {
     status?: string,
     limit: number = 100
   ): Promise<APIResponse<any>> {
-    const gqlQuery = `
-      query ($username: String, $status: MediaListStatus, $limit: Int) {
-        MediaListCollection(userName: $username, type: ANIME, status: $status) {
-          lists {
-            entries {
-              media {
-                id
-                title {
-                  romaji
-                  english
-                }
-                coverImage {
-                  medium
-                  large
-                  extraLarge
-                  color
-                }
-                genres
-                averageScore
-                popularity
-              }
-              status
-              score
-              progress
-              repeat
-              updatedAt
-            }
-          }
-        }
-      }
-    `;
-
     return await this.graphqlRequest(
-      gqlQuery,
+      USER_ANIME_LIST_QUERY,
       {
         username,
         status,
@@ -353,19 +546,8 @@ export class AniListClient extends BaseAPIClient {
       throw new Error('Access token required');
     }
 
-    const gqlQuery = `
-      mutation ($mediaId: Int, $status: MediaListStatus, $score: Float, $progress: Int) {
-        SaveMediaListEntry(mediaId: $mediaId, status: $status, score: $score, progress: $progress) {
-          id
-          status
-          score
-          progress
-        }
-      }
-    `;
-
     return await this.graphqlRequest(
-      gqlQuery,
+      UPDATE_ANIME_STATUS_MUTATION,
       {
         mediaId,
         status,
@@ -385,6 +567,7 @@ export class AniListClient extends BaseAPIClient {
       throw new Error('Access token cannot be empty');
     }
     this.accessToken = accessToken;
+    this.headers = this.buildHeaders();
   }
 
   /**
@@ -394,32 +577,8 @@ export class AniListClient extends BaseAPIClient {
    * @returns API response with user information
    */
   public async getUserInfo(username: string): Promise<APIResponse<UserInfo>> {
-    const query = `
-      query ($name: String) {
-        User(name: $name) {
-          id
-          name
-          avatar {
-            large
-            medium
-          }
-          bannerImage
-          about
-          createdAt
-          statistics {
-            anime {
-              count
-              meanScore
-              minutesWatched
-              episodesWatched
-            }
-          }
-        }
-      }
-    `;
-
     const response = await this.graphqlRequest(
-      query,
+      USER_INFO_QUERY,
       { name: username }
     );
 
@@ -452,46 +611,8 @@ export class AniListClient extends BaseAPIClient {
       throw new Error("Season must be one of: winter, spring, summer, fall");
     }
 
-    const query = `
-      query ($season: MediaSeason, $year: Int, $sort: [MediaSort], $limit: Int) {
-        Page(page: 1, perPage: $limit) {
-          media(season: $season, seasonYear: $year, type: ANIME, sort: $sort) {
-            id
-            title {
-              romaji
-              english
-              native
-            }
-            coverImage {
-              large
-              medium
-            }
-            description
-            format
-            episodes
-            status
-            genres
-            studios {
-              nodes {
-                name
-              }
-            }
-            startDate {
-              year
-              month
-              day
-            }
-            popularity
-            averageScore
-            seasonYear
-            season
-          }
-        }
-      }
-    `;
-
     const response = await this.graphqlRequest(
-      query,
+      SEASON_ANIME_QUERY,
       {
         season,
         year,
@@ -517,46 +638,8 @@ export class AniListClient extends BaseAPIClient {
    * @returns API response with currently airing anime
    */
   public async getCurrentlyAiring(limit: number = 50): Promise<APIResponse<AnimeDetails[]>> {
-    const query = `
-      query ($status: MediaStatus, $sort: [MediaSort], $limit: Int) {
-        Page(page: 1, perPage: $limit) {
-          media(status: $status, type: ANIME, sort: $sort) {
-            id
-            title {
-              romaji
-              english
-              native
-            }
-            coverImage {
-              large
-              medium
-            }
-            description
-            format
-            episodes
-            status
-            genres
-            studios {
-              nodes {
-                name
-              }
-            }
-            startDate {
-              year
-              month
-              day
-            }
-            popularity
-            averageScore
-            seasonYear
-            season
-          }
-        }
-      }
-    `;
-
     const response = await this.graphqlRequest(
-      query,
+      CURRENTLY_AIRING_QUERY,
       {
         status: "RELEASING",
         sort: ["POPULARITY_DESC"],
@@ -582,49 +665,8 @@ export class AniListClient extends BaseAPIClient {
    * @returns API response with popular anime
    */
   public async getPopularAnime(limit: number = 50, page: number = 1): Promise<APIResponse<AnimeDetails[]>> {
-    const query = `
-      query ($page: Int, $perPage: Int, $sort: [MediaSort]) {
-        Page(page: $page, perPage: $perPage) {
-          media(type: ANIME, sort: $sort) {
-            id
-            title {
-              romaji
-              english
-              native
-            }
-            coverImage {
-              large
-              medium
-              extraLarge
-              color
-            }
-            description
-            format
-            episodes
-            status
-            genres
-            studios {
-              nodes {
-                name
-              }
-            }
-            startDate {
-              year
-              month
-              day
-            }
-            popularity
-            averageScore
-            seasonYear
-            season
-            idMal
-          }
-        }
-      }
-    `;
-
     const response = await this.graphqlRequest(
-      query,
+      SORTED_ANIME_PAGE_QUERY,
       {
         page,
         perPage: Math.min(limit, 50),
@@ -650,49 +692,8 @@ export class AniListClient extends BaseAPIClient {
    * @returns API response with top-rated anime
    */
   public async getTopAnime(limit: number = 50, page: number = 1): Promise<APIResponse<AnimeDetails[]>> {
-    const query = `
-      query ($page: Int, $perPage: Int, $sort: [MediaSort]) {
-        Page(page: $page, perPage: $perPage) {
-          media(type: ANIME, sort: $sort) {
-            id
-            title {
-              romaji
-              english
-              native
-            }
-            coverImage {
-              large
-              medium
-              extraLarge
-              color
-            }
-            description
-            format
-            episodes
-            status
-            genres
-            studios {
-              nodes {
-                name
-              }
-            }
-            startDate {
-              year
-              month
-              day
-            }
-            popularity
-            averageScore
-            seasonYear
-            season
-            idMal
-          }
-        }
-      }
-    `;
-
     const response = await this.graphqlRequest(
-      query,
+      SORTED_ANIME_PAGE_QUERY,
       {
         page,
         perPage: Math.min(limit, 50),
@@ -717,36 +718,10 @@ export class AniListClient extends BaseAPIClient {
    * @returns API response with recommended anime
    */
   public async getAnimeRecommendations(animeId: number): Promise<APIResponse<AnimeDetails[]>> {
-    const query = `
-      query ($id: Int) {
-        Media(id: $id, type: ANIME) {
-          recommendations(sort: RATING_DESC) {
-            nodes {
-              mediaRecommendation {
-                id
-                title {
-                  romaji
-                  english
-                  native
-                }
-                description
-                genres
-                coverImage {
-                  medium
-                  large
-                }
-                averageScore
-                popularity
-              }
-            }
-          }
-        }
-      }
-    `;
-
     try {
-      const response = await axios.post(this.endpoint, {
-        query,
+      await this.acquireRateLimit();
+      const response = await httpClient.post(this.endpoint, {
+        query: ANIME_RECOMMENDATIONS_QUERY,
         variables: { id: animeId }
       });
 
@@ -0,0 +1,33 @@
+/**
+ * Tests for the MAL client
+ */
+
+import { MALClient } from './client';
+
+const originalFetch = global.fetch;
+
+afterEach(() => {
+  global.fetch = originalFetch;
+  jest.restoreAllMocks();
+});
+
+describe('MALClient.updateAnimeStatus', () => {
+  test('sends a form-encoded PATCH', async () => {
+    const fetchMock = jest.fn(async () => new Response(JSON.stringify({ status: 'watching', score: 8 }), {
+      status: 200,
+      headers: { 'content-type': 'application/json' }
+    }));
+    global.fetch = fetchMock as unknown as typeof fetch;
+    const client = new MALClient('test-client-id', undefined, 'test-access-token', { enableRateLimit: false });
+
+    const response = await client.updateAnimeStatus(5114, 'watching', 8);
+
+    expect(response.data).toEqual({ status: 'watching', score: 8 });
+    expect(fetchMock).toHaveBeenCalledTimes(1);
+    const [url, init] = fetchMock.mock.calls[0] as unknown as [string, RequestInit];
+    expect(url).toBe('https://api.myanimelist.net/v2/anime/5114/my_list_status');
+    expect(init.method).toBe('PATCH');
+    expect((init.headers as Record<string, string>)['Content-Type']).toBe('application/x-www-form-urlencoded');
+    expect(init.body).toBe('status=watching&score=8');
+  });
+});
@@ -1,5 +1,5 @@
 import { BaseAPIClient, APIResponse } from '../../core/client';
-import axios from 'axios';
+import { httpClient } from '../../core/http';
 
 // MAL Models
 export interface AlternativeTitles {
@@ -74,6 +74,26 @@ export interface AnimeStatus {
   updated_at?: string;
 }
 
+// Default field lists, joined once rather than on every request
+const SEARCH_FIELDS = [
+  'id', 'title', 'main_picture', 'alternative_titles',
+  'synopsis', 'mean', 'popularity', 'num_episodes',
+  'media_type', 'status', 'genres'
+].join(',');
+
+const DETAILS_FIELDS = [
+  'id', 'title', 'main_picture', 'alternative_titles',
+  'synopsis', 'mean', 'popularity', 'num_episodes',
+  'media_type', 'status', 'start_season', 'studios',
+  'source', 'genres'
+].join(',');
+
+const SUGGESTED_FIELDS = [
+  'id', 'title', 'main_picture', 'synopsis',
+  'mean', 'popularity', 'num_episodes', 'media_type',
+  'status', 'genres'
+].join(',');
+
 /**
  * MyAnimeList API client
  *
@@ -84,6 +104,7 @@ export class MALClient extends BaseAPIClient {
   private readonly clientId: string;
   private clientSecret?: string;
   private accessToken?: string;
+  private headers: Record<string, string>;
 
   /**
    * Initialize the MAL client
@@ -107,9 +128,16 @@ export class MALClient extends BaseAPIClient {
     this.clientId = clientId;
     this.clientSecret = clientSecret;
     this.accessToken = accessToken;
+    this.headers = this.buildHeaders();
   }
 
-  private get headers() {
+  /**
+   * Build request headers with authentication if available. Called only when
+   * the token changes; requests reuse the stored headers.
+   *
+   * @returns Headers object with the client ID and token if set
+   */
+  private buildHeaders(): Record<string, string> {
     const headers: Record<string, string> = {
       'X-MAL-CLIENT-ID': this.clientId
     };
@@ -138,20 +166,15 @@ export class MALClient extends BaseAPIClient {
       throw new Error('Search query cannot be empty');
     }
 
-    const fieldList = fields || [
-      'id', 'title', 'main_picture', 'alternative_titles',
-      'synopsis', 'mean', 'popularity', 'num_episodes',
-      'media_type', 'status', 'genres'
-    ];
-
     const params: Record<string, string> = {
       q: query,
       limit: String(Math.min(limit, 100)),
-      fields: fieldList.join(',')
+      fields: fields ? fields.join(',') : SEARCH_FIELDS
     };
 
     try {
-      const response = await axios.get(
+      await this.acquireRateLimit();
+      const response = await httpClient.get(
         `${this.apiBaseUrl}/anime?${new URLSearchParams(params)}`,
         { headers: this.headers }
       );
@@ -183,16 +206,12 @@ export class MALClient extends BaseAPIClient {
     }
 
     const params: Record<string, string> = {
-      fields: [
-        'id', 'title', 'main_picture', 'alternative_titles',
-        'synopsis', 'mean', 'popularity', 'num_episodes',
-        'media_type', 'status', 'start_season', 'studios',
-        'source', 'genres'
-      ].join(',')
+      fields: DETAILS_FIELDS
     };
 
     try {
-      const response = await axios.get(
+      await this.acquireRateLimit();
+      const response = await httpClient.get(
         `${this.apiBaseUrl}/anime/${animeId}?${new URLSearchParams(params)}`,
         { headers: this.headers }
       );
@@ -222,6 +241,7 @@ export class MALClient extends BaseAPIClient {
       throw new Error('Access token cannot be empty');
     }
     this.accessToken = accessToken;
+    this.headers = this.buildHeaders();
   }
 
   /**
@@ -268,17 +288,15 @@ export class MALClient extends BaseAPIClient {
       throw new Error('Access token required for personal list');
     }
 
+    // An undefined status is dropped when the query string and cache key are built
     const params: Record<string, any> = {
       fields: 'list_status,num_episodes,genres,mean,rank,popularity',
       limit: Math.min(limit, 1000),
       offset,
-      sort
+      sort,
+      status: status || undefined
     };
 
-    if (status) {
-      params.status = status;
-    }
-
     return this.request({
       method: 'GET',
       endpoint: `users/${username}/animelist`,
@@ -306,18 +324,20 @@ export class MALClient extends BaseAPIClient {
       throw new Error('Access token required');
     }
 
-    const data: Record<string, any> = {
-      status,
-    };
-
-    if (score !== undefined) data.score = score;
-    if (numWatchedEpisodes !== undefined) data.num_watched_episodes = numWatchedEpisodes;
+    // The list status endpoint takes a form-encoded body, so build it directly
+    // rather than going through an object that would be sent as JSON
+    const body = new URLSearchParams({ status });
+    if (score !== undefined) body.append('score', String(score));
+    if (numWatchedEpisodes !== undefined) body.append('num_watched_episodes', String(numWatchedEpisodes));
 
     return this.request<AnimeStatus>({
       method: 'PATCH',
       endpoint: `anime/${animeId}/my_list_status`,
-      data,
-      headers: this.headers
+      data: body.toString(),
+      headers: {
+        ...this.headers,
+        'Content-Type': 'application/x-www-form-urlencoded'
+      }
     });
   }
 
@@ -346,7 +366,8 @@ export class MALClient extends BaseAPIClient {
     };
 
     try {
-      const response = await axios.get(
+      await this.acquireRateLimit();
+      const response = await httpClient.get(
         `${this.apiBaseUrl}/anime/season/${year}/${season.toLowerCase()}?${new URLSearchParams(params)}`,
         { headers: this.headers }
       );
@@ -383,20 +404,15 @@ export class MALClient extends BaseAPIClient {
       throw new Error('Access token required');
     }
 
-    const fieldList = fields || [
-      'id', 'title', 'main_picture', 'synopsis',
-      'mean', 'popularity', 'num_episodes', 'media_type',
-      'status', 'genres'
-    ];
-
     const params: Record<string, string> = {
       limit: String(Math.min(limit, 100)),
       offset: String(offset),
-      fields: fieldList.join(',')
+      fields: fields ? fields.join(',') : SUGGESTED_FIELDS
     };
 
     try {
-      const response = await axios.get(
+      await this.acquireRateLimit();
+      const response = await httpClient.get(
         `${this.apiBaseUrl}/anime/suggestions?${new URLSearchParams(params)}`,
         { headers: this.headers }
       );
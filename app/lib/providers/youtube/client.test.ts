@@ -0,0 +1,80 @@
+/**
+ * Tests for the YouTube client
+ */
+
+import { YouTubeClient } from './client';
+import { httpClient } from '../../core/http';
+
+// Build a minimal video resource for the given ID
+function videoItem(id: string) {
+  return { kind: 'youtube#video', id, snippet: { title: `Video ${id}` } };
+}
+
+// Answer each videos request with an item for every requested ID
+function mockVideosResponse(ids: string) {
+  return { data: { items: ids.split(',').map(videoItem) } };
+}
+
+function createClient(): YouTubeClient {
+  return new YouTubeClient('test-api-key', { enableCache: false, enableRateLimit: false });
+}
+
+afterEach(() => {
+  jest.restoreAllMocks();
+});
+
+describe('YouTubeClient.getVideoDetailsBatch', () => {
+  const videoIds = Array.from({ length: 51 }, (_, i) => `video${i}`);
+
+  test('splits IDs into requests of at most 50', async () => {
+    const getMock = jest.spyOn(httpClient, 'get').mockImplementation(
+      async (_url: string, config?: any) => mockVideosResponse(config.params.id) as any
+    );
+
+    const detailsById = await createClient().getVideoDetailsBatch(videoIds);
+
+    expect(getMock).toHaveBeenCalledTimes(2);
+    const requestedIds = getMock.mock.calls.map(([, config]) => (config as any).params.id);
+    expect(requestedIds).toEqual([
+      videoIds.slice(0, 50).join(','),
+      videoIds[50]
+    ]);
+    expect(detailsById.size).toBe(51);
+    expect(detailsById.get('video50')?.snippet.title).toBe('Video video50');
+  });
+
+  test('keeps the results of other requests when one fails', async () => {
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+    jest.spyOn(httpClient, 'get').mockImplementation(async (_url: string, config?: any) => {
+      if (config.params.id.startsWith('video0,')) {
+        throw new Error('Request failed');
+      }
+      return mockVideosResponse(config.params.id) as any;
+    });
+
+    const detailsById = await createClient().getVideoDetailsBatch(videoIds);
+
+    expect(detailsById.size).toBe(1);
+    expect(detailsById.has('video0')).toBe(false);
+    expect(detailsById.get('video50')?.id).toBe('video50');
+  });
+});
+
+describe('YouTubeClient.getVideoDetails', () => {
+  test('returns the details for a single video', async () => {
+    const getMock = jest.spyOn(httpClient, 'get').mockImplementation(
+      async (_url: string, config?: any) => mockVideosResponse(config.params.id) as any
+    );
+
+    const details = await createClient().getVideoDetails('abc123');
+
+    expect(getMock).toHaveBeenCalledTimes(1);
+    expect(details?.id).toBe('abc123');
+  });
+
+  test('returns null for a video the API does not return', async () => {
+    jest.spyOn(httpClient, 'get').mockImplementation(async () => ({ data: { items: [] } }) as any);
+
+    expect(await createClient().getVideoDetails('missing')).toBeNull();
+  });
+});
@@ -7,7 +7,8 @@
  */
 
 import { BaseAPIClient, APIResponse } from '../../core/client';
-import axios from 'axios';
+import { httpClient } from '../../core/http';
+import { LRUCache } from '../../core/lru-cache';
 
 // YouTube Models
 export interface VideoThumbnail {
@@ -51,6 +52,26 @@ export interface YouTubeSearchResult {
   };
 }
 
+// Trailer searches cost up to four search calls against a small daily quota,
+// so results are cached at module level and shared by every client instance
+const TRAILER_CACHE_TTL = 24 * 60 * 60 * 1000; // 24 hours in milliseconds
+const MAX_TRAILER_CACHE_SIZE = 1000; // Maximum number of cached titles
+const trailerCache = new LRUCache<string, string | null>({
+  maxSize: MAX_TRAILER_CACHE_SIZE,
+  ttlMs: TRAILER_CACHE_TTL
+});
+
+// The videos endpoint accepts at most this many comma-separated IDs per call
+const YOUTUBE_MAX_IDS_PER_REQUEST = 50;
+
+/**
+ * Normalize an anime title for use as a trailer cache key, so the same title
+ * from different providers (case, spacing or Unicode form) shares one entry
+ */
+function getTrailerCacheKey(animeName: string): string {
+  return animeName.normalize('NFKC').trim().replace(/\s+/g, ' ').toLowerCase();
+}
+
 /**
  * YouTube Data API client implementation
  */
@@ -165,6 +186,12 @@ export class YouTubeClient extends BaseAPIClient {
    * @returns URL of the found anime trailer or null if not found
    */
   async searchAnimeTrailer(animeName: string): Promise<string | null> {
+    const cacheKey = getTrailerCacheKey(animeName);
+    // Misses are cached as null, so check for the key rather than the value
+    if (trailerCache.has(cacheKey)) {
+      return trailerCache.get(cacheKey) ?? null;
+    }
+
     try {
       // Create multiple search queries with different variations for better results
       const searchQueries = [
@@ -176,7 +203,8 @@ export class YouTubeClient extends BaseAPIClient {
       
       // Try each query until we find a good result
       for (const searchQuery of searchQueries) {
-        const response = await axios.get(`${this.apiBaseUrl}/search`, {
+        await this.acquireRateLimit();
+        const response = await httpClient.get(`${this.apiBaseUrl}/search`, {
           params: {
             part: 'snippet',
             q: searchQuery,
@@ -201,10 +229,14 @@ export class YouTubeClient extends BaseAPIClient {
           // Use official trailer if found, otherwise use the first result
           const videoItem = officialTrailer || response.data.items[0];
           const videoId = videoItem.id.videoId;
-          return `https://www.youtube.com/watch?v=${videoId}`;
+          const trailerUrl = `https://www.youtube.com/watch?v=${videoId}`;
+          trailerCache.set(cacheKey, trailerUrl);
+          return trailerUrl;
         }
       }
   
+      // Remember misses too so titles without trailers don't keep spending quota
+      trailerCache.set(cacheKey, null);
       return null;
     } catch (error) {
       console.error('Error searching YouTube:', error);
@@ -219,23 +251,52 @@ export class YouTubeClient extends BaseAPIClient {
    * @returns Detailed video information or null if not found
    */
   async getVideoDetails(videoId: string): Promise<YouTubeSearchResult | null> {
-    try {
-      const response = await axios.get(`${this.apiBaseUrl}/videos`, {
-        params: {
-          part: 'snippet',
-          id: videoId,
-          key: this.apiKey
-        }
-      });
+    const detailsById = await this.getVideoDetailsBatch([videoId]);
+    return detailsById.get(videoId) || null;
+  }
 
-      if (response.data.items && response.data.items.length > 0) {
-        return response.data.items[0];
+  /**
+   * Get detailed information about several videos at once. The videos
+   * endpoint accepts up to 50 comma-separated IDs per call, so IDs are sent
+   * in chunks of that size and the chunks are requested concurrently.
+   *
+   * @param videoIds YouTube video IDs
+   * @param part Parts to include in response (default 'snippet')
+   * @returns Map of video ID to video details; IDs that weren't found are omitted
+   */
+  async getVideoDetailsBatch(
+    videoIds: string[],
+    part: string = 'snippet'
+  ): Promise<Map<string, YouTubeSearchResult>> {
+    const chunks: string[][] = [];
+    for (let i = 0; i < videoIds.length; i += YOUTUBE_MAX_IDS_PER_REQUEST) {
+      chunks.push(videoIds.slice(i, i + YOUTUBE_MAX_IDS_PER_REQUEST));
+    }
+
+    const chunkResults = await Promise.all(chunks.map(async chunk => {
+      try {
+        await this.acquireRateLimit();
+        const response = await httpClient.get(`${this.apiBaseUrl}/videos`, {
+          params: {
+            part,
+            id: chunk.join(','),
+            key: this.apiKey
+          }
+        });
+        return response.data.items || [];
+      } catch (error) {
+        console.error('Error getting video details:', error);
+        return [];
       }
+    }));
 
-      return null;
-    } catch (error) {
-      console.error('Error getting video details:', error);
-      return null;
+    // Split the combined results back out by video ID
+    const detailsById = new Map<string, YouTubeSearchResult>();
+    for (const items of chunkResults) {
+      for (const item of items) {
+        detailsById.set(item.id, item);
+      }
     }
+    return detailsById;
   }
 }
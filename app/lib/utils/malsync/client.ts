@@ -14,6 +14,7 @@ import {
   getTmdbIdFromManualMapping, 
   getMalIdFromManualMapping,
   getFullMapping,
+  manualMappings,
   ManualMapping
 } from './manual-mappings';
 
@@ -41,7 +42,11 @@ export interface MalSyncMapping {
  * MALSync API Client for cross-platform anime ID mappings
  */
 export class MalSyncClient {
-  private cache: Record<string, MalSyncMapping> = {};
+  // Separate caches so lookups don't need to build a prefixed string key.
+  // Each is keyed the same way its lookup matches IDs: manual mappings are
+  // indexed by the AniList ID string, while MAL IDs are compared as numbers
+  private anilistCache: Map<string, MalSyncMapping> = new Map();
+  private malCache: Map<number, MalSyncMapping | null> = new Map();
   
   constructor() {
     // No configuration needed since we only use manual mappings
@@ -75,19 +80,20 @@ export class MalSyncClient {
    * @returns Promise with the mapping data from manual database
    */
   public async getAnilistMapping(anilistId: string | number): Promise<MalSyncMapping | null> {
-    const cacheKey = `anilist-${anilistId}`;
+    const cacheKey = String(anilistId);
     
     // Check cache first
-    if (this.cache[cacheKey]) {
-      return this.cache[cacheKey];
+    const cached = this.anilistCache.get(cacheKey);
+    if (cached) {
+      return cached;
     }
     
     // Check if we have a manual mapping
-    if (hasManualMapping(anilistId)) {
-      const manualMapping = getFullMapping(anilistId);
+    if (hasManualMapping(cacheKey)) {
+      const manualMapping = getFullMapping(cacheKey);
       if (manualMapping) {
         const mapping = this.convertManualMappingToMalSync(manualMapping);
-        this.cache[cacheKey] = mapping;
+        this.anilistCache.set(cacheKey, mapping);
         return mapping;
       }
     }
@@ -103,24 +109,26 @@ export class MalSyncClient {
    * @returns Promise with the mapping data - only returns from matching manual mappings
    */
   public async getMalMapping(malId: string | number): Promise<MalSyncMapping | null> {
-    const cacheKey = `mal-${malId}`;
+    const cacheKey = Number(malId);
     
-    // Check cache first
-    if (this.cache[cacheKey]) {
-      return this.cache[cacheKey];
+    // Check cache first. Misses are cached too, since finding one means
+    // scanning every manual mapping
+    if (this.malCache.has(cacheKey)) {
+      return this.malCache.get(cacheKey)!;
     }
     
     // Search through manual mappings for matching MAL ID
     for (const key in manualMappings) {
       const mapping = manualMappings[key];
-      if (mapping.mal === Number(malId)) {
+      if (mapping.mal === cacheKey) {
         const result = this.convertManualMappingToMalSync(mapping);
-        this.cache[cacheKey] = result;
+        this.malCache.set(cacheKey, result);
         return result;
       }
     }
     
     // No mapping found in manual database
+    this.malCache.set(cacheKey, null);
     return null;
   }
   
@@ -0,0 +1,78 @@
+/**
+ * Tests for profile similarity scoring
+ */
+
+import type { UserProfile } from './data-models';
+import { calculateProfileSimilarity, createProfileSimilarityScorer } from './profile-similarity';
+
+// Helper function to create a test profile with specific dimension values and confidences
+function createTestProfile(dimensions: Record<string, number>, confidences: Record<string, number>): UserProfile {
+  return {
+    userId: 'test-profile',
+    dimensions,
+    confidences,
+    answeredQuestions: [],
+    lastUpdated: new Date().toISOString(),
+    interactionCount: 0
+  };
+}
+
+describe('createProfileSimilarityScorer', () => {
+  // Covers zero, missing and fractional confidences, plus a dimension the
+  // dimension set doesn't define
+  const profile = createTestProfile(
+    {
+      visualComplexity: 8,
+      narrativeComplexity: 3,
+      emotionalValence: -2,
+      moralAmbiguity: 6,
+      abstractConcrete: 4,
+      notADimension: 5
+    },
+    {
+      visualComplexity: 0.9,
+      narrativeComplexity: 0,
+      emotionalValence: 0.4,
+      notADimension: 1
+    }
+  );
+
+  const attributeSets: Array<Record<string, number>> = [
+    // Every profile dimension present
+    { visualComplexity: 7, narrativeComplexity: 9, emotionalValence: 3, moralAmbiguity: 6, abstractConcrete: -5, notADimension: 1 },
+    // Some dimensions missing
+    { visualComplexity: 2, emotionalValence: -5 },
+    // Only the zero-confidence dimension
+    { narrativeComplexity: 1 },
+    // Dimensions the profile doesn't have
+    { characterComplexity: 8, socialComplexity: 2, moralAmbiguity: 1 },
+    // Nothing shared
+    {}
+  ];
+
+  const optionSets = [
+    {},
+    { confidenceWeighting: true, dimensionImportance: true },
+    { confidenceWeighting: false, dimensionImportance: true },
+    { confidenceWeighting: true, dimensionImportance: false },
+    { confidenceWeighting: false, dimensionImportance: false }
+  ];
+
+  test('scores match calculateProfileSimilarity for the same profile and attributes', () => {
+    optionSets.forEach(options => {
+      const scoreSimilarity = createProfileSimilarityScorer(profile, options);
+
+      attributeSets.forEach(attributes => {
+        const expected = calculateProfileSimilarity(profile, attributes, options).overallScore;
+        expect(scoreSimilarity(attributes)).toBeCloseTo(expected, 10);
+      });
+    });
+  });
+
+  test('returns 0 when no dimensions are shared', () => {
+    const scoreSimilarity = createProfileSimilarityScorer(profile);
+
+    expect(scoreSimilarity({})).toBe(0);
+    expect(scoreSimilarity({ notADimension: 5 })).toBe(0);
+  });
+});
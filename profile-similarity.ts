@@ -1,5 +1,5 @@
 import type { UserProfile } from './data-models';
-import { PsychologicalDimensions, normalizeDimension } from './psychological-dimensions';
+import { PsychologicalDimensions } from './psychological-dimensions';
 
 /**
  * Calculate similarity between a user profile and anime attributes
@@ -18,30 +18,27 @@ export function calculateProfileSimilarity(
 } {
   const { confidenceWeighting = true, dimensionImportance = true } = options;
   
-  // Get all dimensions that exist in both profile and anime
-  const sharedDimensions = Object.keys(profile.dimensions)
-    .filter(dim => dim in attributes && dim in PsychologicalDimensions);
-  
-  if (sharedDimensions.length === 0) {
-    return { 
-      overallScore: 0, 
-      dimensionScores: {} 
-    };
-  }
-  
-  // Calculate score for each dimension
+  // Calculate score for each dimension shared by the profile and the anime
   const dimensionScores: { [dimension: string]: number } = {};
   let totalWeight = 0;
   let weightedSum = 0;
   
-  for (const dimension of sharedDimensions) {
-    // Normalize both values to 0-1 for comparison
-    const profileValueNorm = normalizeDimension(dimension, profile.dimensions[dimension]);
-    const animeValueNorm = normalizeDimension(dimension, attributes[dimension]);
+  for (const dimension in profile.dimensions) {
+    // Look up the dimension definition once; skip dimensions the anime or
+    // the dimension set doesn't know about
+    const dimensionInfo = PsychologicalDimensions[dimension];
+    if (!dimensionInfo || !(dimension in attributes)) {
+      continue;
+    }
+    
+    // Normalize both values to 0-1 for comparison. Both share the same
+    // range, so the difference can be scaled once instead of per value
+    const normalizedDiff = (profile.dimensions[dimension] - attributes[dimension]) / 
+      (dimensionInfo.max - dimensionInfo.min);
     
     // Calculate similarity on this dimension (1 - distance)
     // Distance is squared to penalize larger differences more
-    const similarity = 1 - Math.pow(Math.abs(profileValueNorm - animeValueNorm), 2);
+    const similarity = 1 - normalizedDiff * normalizedDiff;
     dimensionScores[dimension] = similarity;
     
     // Calculate weight for this dimension based on confidence and importance
@@ -51,13 +48,8 @@ export function calculateProfileSimilarity(
       weight *= profile.confidences[dimension];
     }
     
-    if (dimensionImportance && PsychologicalDimensions[dimension]) {
-      weight *= PsychologicalDimensions[dimension].importance;
-    }
-    
-    // If no weighting is applied, use equal weights
-    if (!confidenceWeighting && !dimensionImportance) {
-      weight = 1;
+    if (dimensionImportance) {
+      weight *= dimensionInfo.importance;
     }
     
     weightedSum += similarity * weight;
@@ -73,6 +65,69 @@ export function calculateProfileSimilarity(
   };
 }
 
+/**
+ * Build a similarity scorer for one profile that can be applied to many anime
+ * 
+ * The profile's dimensions, value ranges and weights are resolved into flat
+ * arrays once, so scoring each anime is a tight numeric loop. Returns the same
+ * overallScore as calculateProfileSimilarity with the same options.
+ */
+export function createProfileSimilarityScorer(
+  profile: UserProfile,
+  options: {
+    confidenceWeighting?: boolean,  // Whether to weight by confidence
+    dimensionImportance?: boolean   // Whether to weight by dimension importance
+  } = {}
+): (attributes: { [dimension: string]: number }) => number {
+  const { confidenceWeighting = true, dimensionImportance = true } = options;
+  
+  const dimensions: string[] = [];
+  const profileValues: number[] = [];
+  const ranges: number[] = [];
+  const weights: number[] = [];
+  
+  for (const dimension in profile.dimensions) {
+    const dimensionInfo = PsychologicalDimensions[dimension];
+    if (!dimensionInfo) {
+      continue;
+    }
+    
+    let weight = 1.0;
+    
+    if (confidenceWeighting && profile.confidences?.[dimension]) {
+      weight *= profile.confidences[dimension];
+    }
+    
+    if (dimensionImportance) {
+      weight *= dimensionInfo.importance;
+    }
+    
+    dimensions.push(dimension);
+    profileValues.push(profile.dimensions[dimension]);
+    ranges.push(dimensionInfo.max - dimensionInfo.min);
+    weights.push(weight);
+  }
+  
+  return attributes => {
+    let totalWeight = 0;
+    let weightedSum = 0;
+    
+    for (let i = 0; i < dimensions.length; i++) {
+      if (!(dimensions[i] in attributes)) {
+        continue;
+      }
+      
+      const normalizedDiff = (profileValues[i] - attributes[dimensions[i]]) / ranges[i];
+      const similarity = 1 - normalizedDiff * normalizedDiff;
+      
+      weightedSum += similarity * weights[i];
+      totalWeight += weights[i];
+    }
+    
+    return totalWeight > 0 ? weightedSum / totalWeight : 0;
+  };
+}
+
 /**
  * Generate explanation for why an anime matches a user profile
  */
@@ -157,24 +212,28 @@ export function calculateProfileDistance(
   profileA: UserProfile, 
   profileB: UserProfile
 ): number {
-  // Get shared dimensions
-  const sharedDimensions = Object.keys(profileA.dimensions)
-    .filter(dim => dim in profileB.dimensions && dim in PsychologicalDimensions);
-  
-  if (sharedDimensions.length === 0) {
-    return 1; // Maximum distance if no shared dimensions
-  }
-  
-  // Calculate Euclidean distance in normalized space
+  // Calculate Euclidean distance in normalized space over shared dimensions
   let sumSquaredDiff = 0;
+  let sharedCount = 0;
   
-  for (const dimension of sharedDimensions) {
-    const valueA = normalizeDimension(dimension, profileA.dimensions[dimension]);
-    const valueB = normalizeDimension(dimension, profileB.dimensions[dimension]);
+  for (const dimension in profileA.dimensions) {
+    const dimensionInfo = PsychologicalDimensions[dimension];
+    if (!dimensionInfo || !(dimension in profileB.dimensions)) {
+      continue;
+    }
+    
+    // Both values share the same range, so normalize the difference once
+    const diff = (profileA.dimensions[dimension] - profileB.dimensions[dimension]) / 
+      (dimensionInfo.max - dimensionInfo.min);
     
-    sumSquaredDiff += Math.pow(valueA - valueB, 2);
+    sumSquaredDiff += diff * diff;
+    sharedCount++;
+  }
+  
+  if (sharedCount === 0) {
+    return 1; // Maximum distance if no shared dimensions
   }
   
   // Return normalized distance (0-1)
-  return Math.sqrt(sumSquaredDiff / sharedDimensions.length);
+  return Math.sqrt(sumSquaredDiff / sharedCount);
 }
\ No newline at end of file
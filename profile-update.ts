@@ -225,21 +225,22 @@ export function generateProfileAdjustments(
     return [];
   }
   
-  // Calculate average values for each dimension from highly rated anime (rating > 7)
-  const highlyRated = ratedAnime.filter(item => item.rating > 7);
-  if (highlyRated.length === 0) {
-    return [];
-  }
-  
-  const dimensionValues: { [dimension: string]: number[] } = {};
+  // Accumulate count, sum and sum of squares for each dimension from highly
+  // rated anime (rating > 7) in a single pass, so the average and variance
+  // below don't need to re-walk per-dimension value lists
+  const dimensionStats: { 
+    [dimension: string]: { count: number, sum: number, sumSquares: number } 
+  } = {};
   
-  // Collect values for each dimension from highly rated anime
-  for (const { anime } of highlyRated) {
+  for (const { anime, rating } of ratedAnime) {
+    if (rating <= 7) continue;
+    
     for (const [dimension, value] of Object.entries(anime.attributes)) {
-      if (!(dimension in dimensionValues)) {
-        dimensionValues[dimension] = [];
-      }
-      dimensionValues[dimension].push(value);
+      const stats = dimensionStats[dimension] || 
+        (dimensionStats[dimension] = { count: 0, sum: 0, sumSquares: 0 });
+      stats.count++;
+      stats.sum += value;
+      stats.sumSquares += value * value;
     }
   }
   
@@ -252,12 +253,12 @@ export function generateProfileAdjustments(
     explanation: string
   }[] = [];
   
-  for (const [dimension, values] of Object.entries(dimensionValues)) {
+  for (const [dimension, { count, sum, sumSquares }] of Object.entries(dimensionStats)) {
     // Skip dimensions with too few data points
-    if (values.length < 2) continue;
+    if (count < 2) continue;
     
     // Calculate average value from highly rated anime
-    const avgValue = values.reduce((sum, val) => sum + val, 0) / values.length;
+    const avgValue = sum / count;
     
     // Get current profile value
     const currentValue = profile.dimensions[dimension] || 0;
@@ -271,14 +272,14 @@ export function generateProfileAdjustments(
     if (normalizedDiff > 0.25) {
       // Calculate confidence based on number of samples and agreement
       // More samples and lower variance = higher confidence
-      const variance = calculateVariance(values);
+      const variance = Math.max(0, sumSquares / count - avgValue * avgValue);
       const normalizedVariance = variance / 
         Math.pow(PsychologicalDimensions[dimension]?.max - 
                 PsychologicalDimensions[dimension]?.min || 10, 2);
       
       // Confidence based on number of samples and variance
       const confidence = Math.min(
-        0.3 + (values.length / 10) * 0.3, 
+        0.3 + (count / 10) * 0.3, 
         0.8
       ) * Math.max(0.5, 1 - normalizedVariance);
       
@@ -287,7 +288,7 @@ export function generateProfileAdjustments(
         dimension, 
         currentValue, 
         avgValue, 
-        values.length
+        count
       );
       
       adjustments.push({
@@ -306,19 +307,6 @@ export function generateProfileAdjustments(
     .slice(0, 3);
 }
 
-/**
- * Calculate variance of an array of numbers
- */
-function calculateVariance(values: number[]): number {
-  if (values.length <= 1) return 0;
-  
-  const mean = values.reduce((sum, val) => sum + val, 0) / values.length;
-  const squaredDiffs = values.map(val => Math.pow(val - mean, 2));
-  const variance = squaredDiffs.reduce((sum, val) => sum + val, 0) / values.length;
-  
-  return variance;
-}
-
 /**
  * Generate natural language explanation for a profile adjustment
  */
@@ -3,7 +3,7 @@
  */
 
 import type { UserProfile, AnimeTitle } from './data-models';
-import { recommendAnime, calculateMatchScore, diversifyResults, clusterSimilarAnime } from './recommendation-engine';
+import { recommendAnime, calculateMatchScore, diversifyResults, clusterSimilarAnime, selectTopK } from './recommendation-engine';
 
 // Helper function to create a test profile with specific dimension values
 function createTestProfile(dimensions: Record<string, number>, confidences: Record<string, number> = {}): UserProfile {
@@ -214,4 +214,48 @@ describe('Recommendation Engine', () => {
     // Different anime should be in different clusters (anime1 and anime3)
     expect(testAnime[0].cluster).not.toEqual(testAnime[2].cluster);
   });
-});
\ No newline at end of file
+});
+
+describe('selectTopK', () => {
+  const byScore = (item: { id: string; score: number }) => item.score;
+
+  test('returns nothing when k is zero, negative, or not a number', () => {
+    const items = [{ id: 'a', score: 1 }, { id: 'b', score: 2 }];
+
+    expect(selectTopK(items, 0, byScore)).toEqual([]);
+    expect(selectTopK(items, -1, byScore)).toEqual([]);
+    expect(selectTopK(items, NaN, byScore)).toEqual([]);
+  });
+
+  test('returns every item sorted when k exceeds the input length', () => {
+    const items = [{ id: 'a', score: 1 }, { id: 'b', score: 3 }, { id: 'c', score: 2 }];
+
+    expect(selectTopK(items, 10, byScore).map(item => item.id)).toEqual(['b', 'c', 'a']);
+  });
+
+  test('keeps input order for equal scores', () => {
+    const items = [
+      { id: 'a', score: 2 },
+      { id: 'b', score: 5 },
+      { id: 'c', score: 2 },
+      { id: 'd', score: 5 },
+      { id: 'e', score: 2 }
+    ];
+
+    expect(selectTopK(items, 4, byScore).map(item => item.id)).toEqual(['b', 'd', 'a', 'c']);
+  });
+
+  test('matches a full sort followed by a slice', () => {
+    // Small integer scores so ties are common
+    for (let run = 0; run < 200; run++) {
+      const items = Array.from({ length: run % 25 }, (_, i) => ({
+        id: String(i),
+        score: Math.floor(Math.random() * 6)
+      }));
+      const k = run % 8;
+
+      const expected = [...items].sort((a, b) => b.score - a.score).slice(0, k);
+      expect(selectTopK(items, k, byScore)).toEqual(expected);
+    }
+  });
+});
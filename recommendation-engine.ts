@@ -13,7 +13,7 @@
 
 import type { UserProfile, AnimeTitle, RecommendationResult } from './data-models';
 import { PsychologicalDimensions, normalizeDimension } from './psychological-dimensions';
-import { calculateProfileSimilarity, generateMatchReasons } from './profile-similarity';
+import { calculateProfileSimilarity, createProfileSimilarityScorer, generateMatchReasons } from './profile-similarity';
 
 /**
  * Main recommendation function that orchestrates the multi-stage filtering process
@@ -113,19 +113,26 @@ export function initialFiltering(
       .slice(0, 500);
   }
   
+  // The user's side of each comparison is the same for every anime,
+  // so normalize it once up front instead of inside the per-anime loop
+  const userValuesNorm = highConfidenceDimensions.map(dimension =>
+    normalizeDimension(dimension, userProfile.dimensions[dimension])
+  );
+  
+  // Must match on at least half of the high-confidence dimensions
+  const requiredMatches = Math.max(1, Math.floor(highConfidenceDimensions.length / 2));
+  
   // Filter based on high-confidence dimensions only
   return animeDatabase.filter(anime => {
     let matchScore = 0;
     
-    highConfidenceDimensions.forEach(dimension => {
-      const userValue = userProfile.dimensions[dimension];
+    highConfidenceDimensions.forEach((dimension, index) => {
       const animeValue = anime.attributes[dimension];
       
       if (animeValue !== undefined) {
         // Allow matches within a reasonable range
-        const userValueNorm = normalizeDimension(dimension, userValue);
         const animeValueNorm = normalizeDimension(dimension, animeValue);
-        const difference = Math.abs(userValueNorm - animeValueNorm);
+        const difference = Math.abs(userValuesNorm[index] - animeValueNorm);
         
         // Consider it a match if within 30% of the normalized range
         if (difference < 0.3) {
@@ -134,8 +141,6 @@ export function initialFiltering(
       }
     });
     
-    // Must match on at least half of the high-confidence dimensions
-    const requiredMatches = Math.max(1, Math.floor(highConfidenceDimensions.length / 2));
     return matchScore >= requiredMatches;
   });
 }
@@ -252,6 +257,10 @@ export function selectClusterRepresentatives(
     excludeClusters
   );
   
+  // Resolve the profile side of the similarity once for every cluster; this
+  // gives the same scores as calculateMatchScore
+  const scoreSimilarity = createProfileSimilarityScorer(userProfile, MATCH_SCORE_OPTIONS);
+  
   // Select top anime from each relevant cluster
   relevantClusterIds.forEach(clusterId => {
     const cluster = clusters[clusterId];
@@ -260,13 +269,11 @@ export function selectClusterRepresentatives(
     // Score each anime in the cluster
     const scoredAnime = cluster.map(anime => ({
       anime,
-      score: calculateMatchScore(anime, userProfile)
+      score: scoreSimilarity(anime.attributes) + getPopularityBonus(anime)
     }));
     
     // Get top 1-2 from each cluster to ensure more cluster diversity
-    const topFromCluster = scoredAnime
-      .sort((a, b) => b.score - a.score)
-      .slice(0, 2);
+    const topFromCluster = selectTopK(scoredAnime, 2, scored => scored.score);
     
     representatives.push(...topFromCluster);
   });
@@ -419,6 +426,13 @@ function generateAdjacentClusters(features: AnimeFeatureVector): string[] {
   return adjacentClusters;
 }
 
+// Similarity options used for every match score, shared instead of
+// allocating a new options object per scored anime
+const MATCH_SCORE_OPTIONS = Object.freeze({
+  confidenceWeighting: true,
+  dimensionImportance: true
+});
+
 /**
  * Calculate match score between anime and user profile
  * 
@@ -433,13 +447,69 @@ export function calculateMatchScore(
   const similarityResult = calculateProfileSimilarity(
     userProfile, 
     anime.attributes,
-    { confidenceWeighting: true, dimensionImportance: true }
+    MATCH_SCORE_OPTIONS
   );
   
-  // Add a tiny bonus for popularity to break ties between similar anime, but keep it small to avoid dominating the recommendation
-  const popularityBonus = Math.min(anime.popularity, 100) / 5000;
+  return similarityResult.overallScore + getPopularityBonus(anime);
+}
+
+/**
+ * Add a tiny bonus for popularity to break ties between similar anime, but keep it small to avoid dominating the recommendation
+ * 
+ * @param anime Anime to score
+ * @returns Popularity bonus (0-0.02)
+ */
+function getPopularityBonus(anime: AnimeTitle): number {
+  return Math.min(anime.popularity, 100) / 5000;
+}
+
+/**
+ * Select the highest-scoring items without sorting the whole list
+ * 
+ * Keeps a small sorted buffer of the best k items seen so far, which is
+ * much cheaper than a full sort when k is small relative to the input.
+ * Items with equal scores keep their original relative order.
+ * 
+ * @param items Items to select from
+ * @param k Number of items to select
+ * @param getScore Function returning the score of an item
+ * @returns Up to k items sorted by score descending
+ */
+export function selectTopK<T>(
+  items: T[],
+  k: number,
+  getScore: (item: T) => number
+): T[] {
+  if (!(k > 0)) {
+    return [];
+  }
+  
+  const top: T[] = [];
+  const topScores: number[] = [];
+  
+  for (const item of items) {
+    const score = getScore(item);
+    
+    // Skip anything that can't displace the current lowest entry
+    if (top.length >= k && !(score > topScores[top.length - 1])) {
+      continue;
+    }
+    
+    // Insert after any entries with an equal or higher score
+    let index = top.length;
+    while (index > 0 && topScores[index - 1] < score) {
+      index--;
+    }
+    top.splice(index, 0, item);
+    topScores.splice(index, 0, score);
+    
+    if (top.length > k) {
+      top.pop();
+      topScores.pop();
+    }
+  }
   
-  return similarityResult.overallScore + popularityBonus;
+  return top;
 }
 
 /**
@@ -227,9 +227,11 @@ export class RecommendationService {
         return Array.from(this.animeCache.values());
       }
       
-      // Otherwise fetch from API
-      const popularAnime = await this.apiAdapter.getPopularAnime(500);
-      const topAnime = await this.apiAdapter.getTopRatedAnime(500);
+      // Otherwise fetch from API; the two lists are independent so fetch them together
+      const [popularAnime, topAnime] = await Promise.all([
+        this.apiAdapter.getPopularAnime(500),
+        this.apiAdapter.getTopRatedAnime(500)
+      ]);
       
       // Combine and deduplicate
       const uniqueAnimeMap = new Map<string, AnimeTitle>();
@@ -272,55 +274,55 @@ export class RecommendationService {
   /**
    * Batch process anime to get psychological attributes
    * 
+   * Keeps up to `concurrency` detail requests in flight at once. Each worker
+   * picks up the next anime as soon as its previous request settles, so a
+   * single slow response no longer stalls the rest of its batch.
+   * 
    * @param animeList List of anime to process
-   * @returns Enriched anime list
+   * @param concurrency Maximum number of in-flight requests
+   * @returns Enriched anime list, in the same order as the input
    */
   private async batchGetAttributes(
-    animeList: AnimeTitle[]
+    animeList: AnimeTitle[],
+    concurrency: number = 10
   ): Promise<AnimeTitle[]> {
-    // Process in small batches to avoid overwhelming the API
-    const batchSize = 10;
-    const results: AnimeTitle[] = [];
+    const results: AnimeTitle[] = new Array(animeList.length);
+    let nextIndex = 0;
     
-    for (let i = 0; i < animeList.length; i += batchSize) {
-      const batch = animeList.slice(i, i + batchSize);
-      
-      try {
-        // Process batch in parallel
-        const promises = batch.map(async (anime) => {
-          try {
-            // Get anime details to map attributes
-            const details = await this.apiAdapter.getAnimeDetails(anime.id);
-            
-            // Map attributes if we got them
-            if (details && Object.keys(details.attributes || {}).length > 0) {
-              return {
-                ...anime,
-                attributes: details.attributes
-              };
-            }
-            
-            // Otherwise infer attributes from genres and other metadata
-            const inferredAttributes = this.apiAdapter.inferAnimeAttributes(anime);
-            return {
+    const worker = async (): Promise<void> => {
+      while (nextIndex < animeList.length) {
+        const index = nextIndex++;
+        const anime = animeList[index];
+        
+        try {
+          // Get anime details to map attributes
+          const details = await this.apiAdapter.getAnimeDetails(anime.id);
+          
+          // Map attributes if we got them
+          if (details && Object.keys(details.attributes || {}).length > 0) {
+            results[index] = {
               ...anime,
-              attributes: inferredAttributes
+              attributes: details.attributes
             };
-          } catch (error) {
-            console.warn(`Failed to get attributes for anime ${anime.id}:`, error);
-            return anime;
+            continue;
           }
-        });
-        
-        // Wait for all promises to resolve
-        const batchResults = await Promise.all(promises);
-        results.push(...batchResults);
-      } catch (error) {
-        console.error('Error processing batch:', error);
-        // Add the original anime to results
-        results.push(...batch);
+          
+          // Otherwise infer attributes from genres and other metadata
+          const inferredAttributes = this.apiAdapter.inferAnimeAttributes(anime);
+          results[index] = {
+            ...anime,
+            attributes: inferredAttributes
+          };
+        } catch (error) {
+          console.warn(`Failed to get attributes for anime ${anime.id}:`, error);
+          results[index] = anime;
+        }
       }
-    }
+    };
+    
+    // Start a bounded pool of workers to avoid overwhelming the API
+    const workerCount = Math.min(concurrency, animeList.length);
+    await Promise.all(Array.from({ length: workerCount }, () => worker()));
     
     return results;
   }
@@ -363,26 +365,23 @@ export class RecommendationService {
   private async enrichRecommendations(
     recommendations: RecommendationResult[]
   ): Promise<RecommendationResult[]> {
-    const enriched = [];
-    
-    for (const rec of recommendations) {
+    // Trailer lookups are independent network calls, so run them concurrently
+    return Promise.all(recommendations.map(async (rec) => {
       try {
         // Try to get trailer if missing
         if (!rec.anime.externalIds?.youtubeTrailerId) {
           const enrichedAnime = await this.apiAdapter.enrichWithTrailer(rec.anime);
-          enriched.push({
+          return {
             ...rec,
             anime: enrichedAnime
-          });
-        } else {
-          enriched.push(rec);
+          };
         }
+        
+        return rec;
       } catch (error) {
         // If enrichment fails, keep the original
-        enriched.push(rec);
+        return rec;
       }
-    }
-    
-    return enriched;
+    }));
   }
 }
\ No newline at end of file